@@ -1,14 +1,22 @@
 from .bots import (
     Bot,
+    BotRunner,
     BotInfo,
     LabeledPrice,
+    OffsetStore,
+    FileOffsetStore,
+    SQLiteOffsetStore,
+    PollingController,
+    PriorityLanes,
+    RateLimiter,
 )
-from .filters import Filters, Filter
+from .filters import Filters, Filter, KeywordAutomaton
 from .keyboards import ReplyKeyboardMarkup, ReplyKeyboardButton, ReplyKeyboardRemove, ReplyWebAppInfo
 from .keyboards import InlineKeyboardMarkup, InlineKeyboardButton, InlineWebAppInfo, CopyTextButton
 from .updates import (
     UpdateWrapper,
     CallbackQuery,
+    PreCheckoutQuery,
     Message,
     Chat,
     ChatMember,
@@ -45,12 +53,19 @@ from .otps import (
     UnexpectedResponseError,
     OTP
 )
-from .enums import ChatAction, ChatMemberStatus, StickerType, ChatType, ContentType, InvoicePayload, MessageEntityType, ParseMode
+from .enums import BacklogPolicy, ChatAction, ChatMemberStatus, StickerType, ChatType, ContentType, InvoicePayload, MessageEntityType, ParseMode
 
 __all__ = [
     'Bot',
+    'BotRunner',
     'BotInfo',
     'LabeledPrice',
+    'OffsetStore',
+    'FileOffsetStore',
+    'SQLiteOffsetStore',
+    'PollingController',
+    'PriorityLanes',
+    'RateLimiter',
 
     'ReplyKeyboardMarkup',
     'ReplyKeyboardButton',
@@ -70,6 +85,7 @@ __all__ = [
     'InputFile',
     'ChatPhoto',
 
+    'BacklogPolicy',
     'ChatAction',
     'ChatMemberStatus',
     'ChatType',
@@ -81,9 +97,11 @@ __all__ = [
 
     'Filters',
     'Filter',
+    'KeywordAutomaton',
 
     'UpdateWrapper',
     'CallbackQuery',
+    'PreCheckoutQuery',
     'Message',
     'User',
     'Chat',
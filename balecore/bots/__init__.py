@@ -1,9 +1,21 @@
 from .bot import Bot
+from .bot_runner import BotRunner
 from .bot_info import BotInfo
 from .labeled_price import LabeledPrice
+from .offset_store import OffsetStore, FileOffsetStore, SQLiteOffsetStore
+from .polling_controller import PollingController
+from .priority_lanes import PriorityLanes
+from .rate_limiter import RateLimiter
 
 __all__ = [
     'Bot',
+    'BotRunner',
     'BotInfo',
-    'LabeledPrice'
+    'LabeledPrice',
+    'OffsetStore',
+    'FileOffsetStore',
+    'SQLiteOffsetStore',
+    'PollingController',
+    'PriorityLanes',
+    'RateLimiter'
 ]
\ No newline at end of file
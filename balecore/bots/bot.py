@@ -1,21 +1,30 @@
 import aiohttp
+from aiohttp import web
 import asyncio
-from typing import Callable, Optional, Dict, Any, List, Union, overload, Tuple, TypeVar, Sequence
+from typing import Callable, Optional, Dict, Any, List, Union, overload, Tuple, TypeVar, Sequence, Deque
 from re import Pattern as re_Pattern
-from collections import namedtuple, defaultdict
+from collections import namedtuple, defaultdict, deque
 import os
+import socket
+import multiprocessing
+import queue
 from io import BytesIO
 import re
 import sys
 import base64
-from functools import wraps
+import hmac
+from functools import wraps, partial, reduce
 import json
+import time
+from contextvars import ContextVar
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
 
 from ..filters.filters import Filters
 from ..filters.base_filter import Filter
+from ..filters.pattern_set import PatternSet
+from ..filters.filter_context import current_update
 from ..updates.update_wrapper import UpdateWrapper
 from ..updates.message import Message
-import inspect
 from ..updates import (
     UpdateWrapper,
     PhotoSize,
@@ -23,11 +32,23 @@ from ..updates import (
     InputMediaVideo
 )
 from .transaction import Transaction
+from .offset_store import OffsetStore
+from .update_deduplicator import UpdateDeduplicator
+from .polling_controller import PollingController
+from .priority_lanes import PriorityLanes
+from .rate_limiter import RateLimiter
+from .command_router import CommandRouter
+from .callback_router import CallbackRouter
+from .handler_invoker import build_invoker
+from .middleware import MIDDLEWARE_STAGES, compose_middleware, wrap_invoker
 from .bot_info import BotInfo
 from .logger import setup_logger
+from ..enums.backlog_policy import BacklogPolicy
 
 logger = setup_logger(__name__)
 
+handler_deadline: ContextVar[Optional[float]] = ContextVar("handler_deadline", default=None)
+
 F = TypeVar('F', bound=Callable)
 T = TypeVar('T', bound=Union[Callable[..., Any], 'Bot'])
 MessageFilter = Union[
@@ -87,35 +108,122 @@ class Bot:
         token: str,
         url: Optional[str] = None,
         concurrency_limit: Optional[int] = 120,
-        proxy: Optional[str] = None
+        proxy: Optional[str] = None,
+        queue_size: Optional[int] = 1000,
+        offset_store: Optional[OffsetStore] = None,
+        dedup_window: Optional[int] = 10000,
+        polling_controller: Optional[PollingController] = None,
+        backlog_policy: Optional[Union[BacklogPolicy, str]] = None,
+        backlog_max_age: int = 60,
+        backlog_concurrency: int = 500,
+        ordering: Optional[str] = None,
+        handler_timeout: Optional[float] = None,
+        priority_lanes: Optional[PriorityLanes] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        thread_executor: Optional[Executor] = None,
+        process_executor: Optional[Executor] = None
     ) -> None:
+        if ordering not in (None, "chat", "user"):
+            raise ValueError("ordering must be None, 'chat' or 'user'")
+
         self.token = token
         self.base_url = url if url is not None else "https://tapi.bale.ai"
         self.handlers: List[Dict] = []
         self.callback_handlers: List[Dict] = []
+        self.pre_checkout_handlers: List[Dict] = []
+        self.middlewares: Dict[str, List[Callable]] = {stage: [] for stage in MIDDLEWARE_STAGES}
+        self._pre_filter: Optional[Callable] = None
+        self._pre_handler: Optional[Callable] = None
+        self._post_handler: Optional[Callable] = None
+        self.callback_router = CallbackRouter(self.callback_handlers)
+        self._allowed_updates: Optional[List[str]] = None
         self.running = asyncio.Event()
         self.user_states: Dict[str, Dict[int, str]] = {}
         self.user_data: Dict[str, Dict[str, Any]] = defaultdict(dict)
+        self.pattern_set = PatternSet()
         self.filters = Filters(self)
+        self.command_router = CommandRouter(self.handlers, self.pattern_set)
         self.initialize_handlers: List[Callable] = []
         self.concurrency_limit = concurrency_limit
         self.active_tasks = set()
         self.proxy = proxy
         self.semaphore = asyncio.Semaphore(concurrency_limit if concurrency_limit else 120)
         self.session: Optional[aiohttp.ClientSession] = None
+        self.owns_session = False
+        self.queue_size = queue_size
+        self.update_queue: Optional[asyncio.Queue] = None
+        self.webhook_secret_token: Optional[str] = None
+        self.offset_store = offset_store
+        self.deduplicator = UpdateDeduplicator(dedup_window) if dedup_window else None
+        self.polling_controller = polling_controller
+        self.backlog_policy = BacklogPolicy(backlog_policy) if backlog_policy else None
+        self.backlog_max_age = backlog_max_age
+        self.backlog_concurrency = backlog_concurrency
+        self.backlog_report: Optional[Dict[str, Any]] = None
+        self.ordering = ordering
+        self.keyed_queues: Dict[int, Deque] = {}
+        self.keyed_depth = 0
+        self._keyed_room = asyncio.Event()
+        self.handler_timeout = handler_timeout
+        self.timed_out_handlers = 0
+        self.priority_lanes = priority_lanes
+        self.rate_limiter = rate_limiter
+        self._thread_executor = thread_executor
+        self._process_executor = process_executor
+        self._owned_executors: List[Executor] = []
+
+    @property
+    def thread_executor(self) -> Executor:
+        if self._thread_executor is None:
+            self._thread_executor = ThreadPoolExecutor(thread_name_prefix="balecore-handler")
+            self._owned_executors.append(self._thread_executor)
+        return self._thread_executor
+
+    @property
+    def process_executor(self) -> Executor:
+        if self._process_executor is None:
+            self._process_executor = ProcessPoolExecutor()
+            self._owned_executors.append(self._process_executor)
+        return self._process_executor
+
+    def _shutdown_executors(self) -> None:
+        for executor in self._owned_executors:
+            executor.shutdown(wait=False)
+            if executor is self._thread_executor:
+                self._thread_executor = None
+            if executor is self._process_executor:
+                self._process_executor = None
+        self._owned_executors.clear()
 
     async def _create_session(self):
         if self.session is None or self.session.closed:
             self.session = aiohttp.ClientSession(
                 timeout=aiohttp.ClientTimeout(total=30),
             )
+            self.owns_session = True
             logger.debug("New aiohttp ClientSession created.")
 
     async def _close_session(self):
-        if self.session and not self.session.closed:
+        if self.owns_session and self.session and not self.session.closed:
             await self.session.close()
             logger.debug("aiohttp ClientSession closed.")
 
+    def _request_timeout(self, total: Optional[float] = None) -> aiohttp.ClientTimeout:
+        base = self.session.timeout if total is None else aiohttp.ClientTimeout(total=total)
+        deadline = handler_deadline.get()
+        if deadline is None:
+            return base
+
+        remaining = max(deadline - asyncio.get_running_loop().time(), 0.001)
+        if base.total is not None and base.total <= remaining:
+            return base
+        return aiohttp.ClientTimeout(
+            total=remaining,
+            connect=base.connect,
+            sock_read=base.sock_read,
+            sock_connect=base.sock_connect
+        )
+
     async def set_webhook(
         self,
         url: str,
@@ -129,6 +237,9 @@ class Bot:
         webhook_url = f"{self.base_url}/bot{self.token}/setWebhook"
         params = {"url": url}
 
+        if allowed_updates is None:
+            allowed_updates = self.allowed_updates
+
         if ip_address:
             params["ip_address"] = ip_address
         if max_connections:
@@ -170,14 +281,16 @@ class Bot:
                 async with self.session.post(
                     webhook_url,
                     data=form,
-                    proxy=self.proxy
+                    proxy=self.proxy,
+                    timeout=self._request_timeout()
                 ) as response:
                     return await response.json()
             else:
                 async with self.session.post(
                     webhook_url,
                     json=params,
-                    proxy=self.proxy
+                    proxy=self.proxy,
+                    timeout=self._request_timeout()
                 ) as response:
                     return await response.json()
         except Exception as e:
@@ -188,7 +301,7 @@ class Bot:
         url = f"{self.base_url}/bot{self.token}/getWebhookInfo"
 
         try:
-            async with self.session.get(url, proxy=self.proxy) as response:
+            async with self.session.get(url, proxy=self.proxy, timeout=self._request_timeout()) as response:
                 return await response.json()
         except Exception as e:
             logger.error(f"Error getting webhook info: {str(e)}")
@@ -208,7 +321,8 @@ class Bot:
             async with self.session.post(
                 url,
                 json=params,
-                proxy=self.proxy
+                proxy=self.proxy,
+                timeout=self._request_timeout()
             ) as response:
                 return await response.json()
         except Exception as e:
@@ -223,7 +337,7 @@ class Bot:
         params = {"chat_id": chat_id}
 
         try:
-            async with self.session.post(url, json=params, proxy=self.proxy) as response:
+            async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
                 response_data = await response.json()
 
                 if not response_data.get("ok"):
@@ -283,6 +397,53 @@ class Bot:
         if self.token in self.user_states and user_id in self.user_states[self.token]:
             del self.user_states[self.token][user_id]
 
+    def _register_handler(self, handlers: List[Dict], handler: Dict) -> None:
+        handler["invoke"] = self._build_handler_invoker(handler)
+        if isinstance(handler.get("filter"), Filter):
+            handler["filter"].compile()
+        handlers.append(handler)
+        self._allowed_updates = None
+
+    def _handler_invoker(self, handler: Dict) -> Callable[[Any], Any]:
+        invoke = handler.get("invoke")
+        if invoke is None:
+            invoke = handler["invoke"] = self._build_handler_invoker(handler)
+        return invoke
+
+    def _build_handler_invoker(self, handler: Dict) -> Callable[[Any], Any]:
+        return wrap_invoker(
+            handler,
+            build_invoker(self, handler["func"], cpu_bound=handler.get("cpu_bound", False)),
+            self._post_handler
+        )
+
+    def Middleware(self, stage: str) -> Callable:
+        if stage not in MIDDLEWARE_STAGES:
+            raise ValueError(f"Middleware stage must be one of {', '.join(MIDDLEWARE_STAGES)}")
+
+        def decorator(func: Callable) -> Callable:
+            self.middlewares[stage].append(func)
+            self._compose_middleware()
+            return func
+        return decorator
+
+    def _compose_middleware(self) -> None:
+        self._pre_filter = compose_middleware(self.middlewares["pre_filter"])
+        self._pre_handler = compose_middleware(self.middlewares["pre_handler"])
+        self._post_handler = compose_middleware(self.middlewares["post_handler"])
+        for handler in self.handlers + self.callback_handlers + self.pre_checkout_handlers:
+            handler["invoke"] = self._build_handler_invoker(handler)
+
+    @property
+    def allowed_updates(self) -> Optional[List[str]]:
+        if self._allowed_updates is None:
+            self._allowed_updates = sorted({
+                handler["update_type"]
+                for handler in self.handlers + self.callback_handlers + self.pre_checkout_handlers
+                if "update_type" in handler
+            })
+        return self._allowed_updates or None
+
     @property
     def Message(self):
         return self._message_decorator
@@ -296,7 +457,9 @@ class Bot:
         pattern: Optional[Union[str, re_Pattern[str]]] = None,
         content_types: Optional[List[str]] = None,
         state: Optional[str] = None,
-        custom_filter: Optional[Callable[[Dict[str, Any]], bool]] = None
+        custom_filter: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
+        cpu_bound: bool = False
     ) -> Union[Callable[[F], F], F]:
         if any([commands, pattern, content_types, state, custom_filter]):
             if __filter is not None:
@@ -313,13 +476,7 @@ class Bot:
                 if isinstance(pattern, str):
                     filters.append(self.filters.pattern(pattern))
                 elif isinstance(pattern, re_Pattern):
-                    filters.append(Filter(
-                        lambda update: (
-                            "message" in update
-                            and "text" in update["message"]
-                            and bool(pattern.match(update["message"]["text"]))
-                        )
-                    ))
+                    filters.append(self.filters.regex(pattern))
 
             if content_types:
                 type_filters = {
@@ -345,7 +502,7 @@ class Bot:
                 filters.append(self.filters.custom(custom_filter))
 
             chosen_filter = (
-                Filter(lambda update: all(f(update) for f in filters))
+                reduce(lambda left, right: left & right, filters)
                 if filters else
                 self.filters.any_message
             )
@@ -357,11 +514,17 @@ class Bot:
             )
 
         if __func is not None:
-            self.handlers.append({"filter": chosen_filter, "func": __func})
+            self._register_handler(
+                self.handlers,
+                {"filter": chosen_filter, "func": __func, "update_type": "message", "timeout": timeout, "cpu_bound": cpu_bound}
+            )
             return __func
 
         def decorator(func: F) -> F:
-            self.handlers.append({"filter": chosen_filter, "func": func})
+            self._register_handler(
+                self.handlers,
+                {"filter": chosen_filter, "func": func, "update_type": "message", "timeout": timeout, "cpu_bound": cpu_bound}
+            )
             return func
 
         return decorator
@@ -380,7 +543,9 @@ class Bot:
         pattern: Optional[Union[str, re_Pattern[str]]] = None,
         content_types: Optional[List[str]] = None,
         state: Optional[str] = None,
-        custom_filter: Optional[Callable[[Dict[str, Any]], bool]] = None
+        custom_filter: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
+        cpu_bound: bool = False
     ) -> Callable[[F], F]: ...
 
     @overload
@@ -398,7 +563,9 @@ class Bot:
         pattern: Optional[Union[str, re_Pattern[str]]] = None,
         content_types: Optional[List[str]] = None,
         state: Optional[str] = None,
-        custom_filter: Optional[Callable[[Dict[str, Any]], bool]] = None
+        custom_filter: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
+        cpu_bound: bool = False
     ) -> Union[Callable[[F], F], F]:
         if any([commands, pattern, content_types, state, custom_filter]):
             if __filter is not None:
@@ -415,13 +582,7 @@ class Bot:
                 if isinstance(pattern, str):
                     filters.append(self.filters.pattern(pattern))
                 elif isinstance(pattern, re_Pattern):
-                    filters.append(Filter(
-                        lambda update: (
-                            "message" in update
-                            and "text" in update["message"]
-                            and bool(pattern.match(update["message"]["text"]))
-                        )
-                    ))
+                    filters.append(self.filters.regex(pattern))
 
             if content_types:
                 type_filters = {
@@ -447,7 +608,7 @@ class Bot:
                 filters.append(self.filters.custom(custom_filter))
 
             chosen_filter = (
-                Filter(lambda update: all(f(update) for f in filters))
+                reduce(lambda left, right: left & right, filters)
                 if filters else
                 self.filters.any_message
             )
@@ -459,11 +620,17 @@ class Bot:
             )
 
         if __func is not None:
-            self.handlers.append({"filter": chosen_filter, "func": __func})
+            self._register_handler(
+                self.handlers,
+                {"filter": chosen_filter, "func": __func, "update_type": "message", "timeout": timeout, "cpu_bound": cpu_bound}
+            )
             return __func
 
         def decorator(func: F) -> F:
-            self.handlers.append({"filter": chosen_filter, "func": func})
+            self._register_handler(
+                self.handlers,
+                {"filter": chosen_filter, "func": func, "update_type": "message", "timeout": timeout, "cpu_bound": cpu_bound}
+            )
             return func
 
         return decorator
@@ -473,7 +640,7 @@ class Bot:
     ):
         url = f"{self.base_url}/bot{self.token}/getMe"
         try:
-            async with self.session.get(url) as response:
+            async with self.session.get(url, timeout=self._request_timeout()) as response:
                 data = await response.json()
                 if data.get("ok"):
                     result = data["result"]
@@ -497,15 +664,18 @@ class Bot:
         self,
         offset=None,
         limit=120,
-        timeout=30
+        timeout=30,
+        allowed_updates: Optional[List[str]] = None
     ):
         url = f"{self.base_url}/bot{self.token}/getUpdates"
         params = {"timeout": timeout, "limit": limit}
         if offset is not None:
             params["offset"] = offset
+        if allowed_updates is not None:
+            params["allowed_updates"] = json.dumps(allowed_updates)
 
         try:
-            async with self.session.get(url, params=params, proxy=self.proxy) as response:
+            async with self.session.get(url, params=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
                 if response.status != 200:
                     logger.error(f"HTTP Error: {response.status}")
                     return None
@@ -581,92 +751,185 @@ class Bot:
 
     async def _process_update(self, update_wrapper):
         async with self.semaphore:
+            await self._handle_update(update_wrapper)
+
+    async def _run_with_deadline(
+        self,
+        handler: Dict,
+        update_wrapper,
+        handler_call: Callable[[], Any],
+        on_timeout: Optional[Callable[[], Any]] = None
+    ) -> Any:
+        timeout = handler.get("timeout")
+        if timeout is None:
+            timeout = self.handler_timeout
+        if timeout is None:
+            return await handler_call()
+
+        token = handler_deadline.set(asyncio.get_running_loop().time() + timeout)
+        try:
+            return await asyncio.wait_for(handler_call(), timeout)
+        except asyncio.TimeoutError:
+            self.timed_out_handlers += 1
+            logger.error(
+                f"Handler {getattr(handler['func'], '__name__', handler['func'])} timed out after {timeout}s "
+                f"on update {update_wrapper.update.get('update_id')}: {update_wrapper.update}"
+            )
+        finally:
+            handler_deadline.reset(token)
+
+        if on_timeout is not None:
+            await on_timeout()
+
+    async def _handle_pre_checkout(self, update_wrapper):
+        query = update_wrapper.pre_checkout_query
+
+        for handler in self.pre_checkout_handlers:
+            update_wrapper.filter_results = None
+            if not handler["filter"](update_wrapper.update):
+                continue
+            if self._pre_handler is not None and await self._pre_handler(update_wrapper, handler) is False:
+                continue
+
+            invoke = self._handler_invoker(handler)
+            on_timeout = None
+            if handler.get("auto_answer"):
+                on_timeout = partial(
+                    self.answer_pre_checkout_query,
+                    query.id,
+                    ok=False,
+                    error_message=handler.get("error_message")
+                )
+
             try:
-                if hasattr(update_wrapper, 'callback_query') and update_wrapper.callback_query:
-                    callback_data = update_wrapper.callback_query.data
-                    update_wrapper.callback_query.message.bot = self
-
-                    for handler in self.callback_handlers:
-                        if handler["filter"](update_wrapper.update):
-                            try:
-                                async def callback_handler():
-                                    try:
-                                        handler_func = handler["func"]
-                                        sig = inspect.signature(handler_func)
-                                        params = {}
-
-                                        if 'bot' in sig.parameters:
-                                            params['bot'] = self
-                                        if 'update' in sig.parameters:
-                                            params['update'] = update_wrapper.update
-                                        if 'callback_query' in sig.parameters:
-                                            params['callback_query'] = update_wrapper.callback_query
-
-                                        result = await handler_func(**params)
-                                        if result and not result.get("ok"):
-                                            logger.error(f"Callback handler execution failed: {result.get('description')}")
-                                        return result or {"ok": True}
-                                    except Exception as e:
-                                        logger.error(f"Callback handler runtime error: {str(e)}")
-                                        return {"ok": False, "description": str(e)}
-
-                                await self.retry_on_errors(
+                await self._run_with_deadline(
+                    handler,
+                    update_wrapper,
+                    partial(invoke, update_wrapper),
+                    on_timeout=on_timeout
+                )
+            except Exception as e:
+                logger.error(f"Pre-checkout handler runtime error: {str(e)}")
+            return
+
+    async def _handle_update(self, update_wrapper):
+        token = current_update.set(update_wrapper)
+        try:
+            await self._route_update(update_wrapper)
+        finally:
+            current_update.reset(token)
+
+    async def _route_update(self, update_wrapper):
+        if self._pre_filter is not None and await self._pre_filter(update_wrapper) is False:
+            return
+
+        if update_wrapper.pre_checkout_query is not None:
+            await self._handle_pre_checkout(update_wrapper)
+            return
+
+        try:
+            if hasattr(update_wrapper, 'callback_query') and update_wrapper.callback_query:
+                callback_data = update_wrapper.callback_query.data
+                update_wrapper.callback_query.message.bot = self
+
+                for handler, suffix in self.callback_router.candidates(callback_data):
+                    update_wrapper.filter_results = None
+                    if handler["filter"](update_wrapper.update):
+                        update_wrapper.callback_query.suffix = suffix
+                        if self._pre_handler is not None and await self._pre_handler(update_wrapper, handler) is False:
+                            continue
+                        try:
+                            invoke = self._handler_invoker(handler)
+
+                            async def callback_handler():
+                                try:
+                                    result = await invoke(update_wrapper)
+                                    if result and not result.get("ok"):
+                                        logger.error(f"Callback handler execution failed: {result.get('description')}")
+                                    return result or {"ok": True}
+                                except Exception as e:
+                                    logger.error(f"Callback handler runtime error: {str(e)}")
+                                    return {"ok": False, "description": str(e)}
+
+                            await self._run_with_deadline(
+                                handler,
+                                update_wrapper,
+                                lambda: self.retry_on_errors(
                                     callback_handler,
                                     max_retries=5,
                                     allowed_errors=(420, 404)
                                 )
-                            except Exception as e:
-                                logger.error(f"Callback handler processing error: {str(e)}")
-                            return
-
-                if hasattr(update_wrapper, 'message') and update_wrapper.message:
-                    update_wrapper.message.bot = self
-
-                    for handler in self.handlers:
-                        if handler["filter"](update_wrapper.update):
-                            try:
-                                async def message_handler():
-                                    try:
-                                        handler_func = handler["func"]
-                                        sig = inspect.signature(handler_func)
-                                        params = {}
-
-                                        if 'bot' in sig.parameters:
-                                            params['bot'] = self
-                                        if 'update' in sig.parameters:
-                                            params['update'] = update_wrapper.update
-                                        if 'message' in sig.parameters:
-                                            params['message'] = update_wrapper.message
-
-                                        if len(sig.parameters) == 1 and 'message' in sig.parameters:
-                                            result = await handler_func(update_wrapper.message)
-                                        else:
-                                            result = await handler_func(**params)
-
-                                        if result and not result.get("ok"):
-                                            logger.error(f"Message handler execution failed: {result.get('description')}")
-                                        return result or {"ok": True}
-                                    except Exception as e:
-                                        logger.error(f"Message handler runtime error: {str(e)}")
-                                        return {"ok": False, "description": str(e)}
-
-                                await self.retry_on_errors(
+                            )
+                        except Exception as e:
+                            logger.error(f"Callback handler processing error: {str(e)}")
+                        return
+
+            if hasattr(update_wrapper, 'message') and update_wrapper.message:
+                update_wrapper.message.bot = self
+
+                for handler in self.command_router.candidates(update_wrapper.update):
+                    update_wrapper.filter_results = None
+                    if handler["filter"](update_wrapper.update):
+                        if self._pre_handler is not None and await self._pre_handler(update_wrapper, handler) is False:
+                            continue
+                        try:
+                            invoke = self._handler_invoker(handler)
+
+                            async def message_handler():
+                                try:
+                                    result = await invoke(update_wrapper)
+
+                                    if result and not result.get("ok"):
+                                        logger.error(f"Message handler execution failed: {result.get('description')}")
+                                    return result or {"ok": True}
+                                except Exception as e:
+                                    logger.error(f"Message handler runtime error: {str(e)}")
+                                    return {"ok": False, "description": str(e)}
+
+                            await self._run_with_deadline(
+                                handler,
+                                update_wrapper,
+                                lambda: self.retry_on_errors(
                                     message_handler,
                                     max_retries=5,
                                     allowed_errors=(420, 404)
                                 )
-                            except Exception as e:
-                                logger.error(f"Message handler processing error: {str(e)}")
-                            return
-            except Exception as e:
-                logger.error(f"Update processing pipeline error: {str(e)}")
+                            )
+                        except Exception as e:
+                            logger.error(f"Message handler processing error: {str(e)}")
+                        return
+        except Exception as e:
+            logger.error(f"Update processing pipeline error: {str(e)}")
 
-    async def process_updates(self):
+    async def _fetch_updates(self, parallel_backlog: bool = True):
         offset = None
+        if self.offset_store is not None:
+            committed = self.offset_store.load()
+            if committed is not None:
+                offset = committed + 1
+                logger.info(f"Resuming polling from update {offset}")
+
+        if self.backlog_policy is not None:
+            offset = await self._drain_backlog(offset, parallel=parallel_backlog)
+
         while self.running.is_set():
             try:
+                if self.offset_store is not None:
+                    await self.offset_store.wait_for_window()
+
                 async def get_updates_wrapper():
-                    updates = await self.get_updates(offset=offset)
+                    if self.polling_controller is not None:
+                        updates = await self.get_updates(
+                            offset=offset,
+                            limit=self.polling_controller.limit,
+                            timeout=self.polling_controller.timeout,
+                            allowed_updates=self.allowed_updates
+                        )
+                    else:
+                        updates = await self.get_updates(
+                            offset=offset,
+                            allowed_updates=self.allowed_updates
+                        )
                     if updates is None:
                         raise Exception("Invalid response or empty updates received")
                     return updates or []
@@ -677,20 +940,359 @@ class Bot:
                             allowed_errors=(420, 404, 500)
                         )
 
-                tasks = []
                 for update in updates:
+                    await self._enqueue_update(update)
                     offset = update["update_id"] + 1
-                    update_wrapper = UpdateWrapper(update)
-                    task = asyncio.create_task(self._process_update(update_wrapper))
-                    tasks.append(task)
 
-                await asyncio.gather(*tasks, return_exceptions=True)
+                if self.offset_store is not None:
+                    self.offset_store.commit()
+
+                if self.polling_controller is not None:
+                    self.polling_controller.update(
+                        len(updates),
+                        self.update_queue.qsize(),
+                        self.update_queue.maxsize,
+                        len(self.active_tasks)
+                    )
+                    if self.polling_controller.delay:
+                        await asyncio.sleep(self.polling_controller.delay)
 
             except Exception as e:
                 error_code = getattr(e, 'code', None)
                 if error_code not in (420, 404):
                     logger.error(f"Critical error in update processing loop: {e}")
 
+    async def _enqueue_update(self, update: Dict[str, Any]) -> bool:
+        update_id = update["update_id"]
+        if self.deduplicator is not None and self.deduplicator.is_duplicate(update_id):
+            logger.debug(f"Dropped duplicate update {update_id}")
+            return False
+        if self.offset_store is not None:
+            self.offset_store.mark_fetched(update_id)
+        await self.update_queue.put(UpdateWrapper(update))
+        return True
+
+    @staticmethod
+    def _update_chat_id(update: Dict[str, Any]) -> Optional[int]:
+        if "message" in update:
+            return update["message"].get("chat", {}).get("id")
+        if "callback_query" in update:
+            callback_query = update["callback_query"]
+            if "message" in callback_query:
+                return callback_query["message"].get("chat", {}).get("id")
+            return callback_query.get("from", {}).get("id")
+        return None
+
+    @staticmethod
+    def _update_user_id(update: Dict[str, Any]) -> Optional[int]:
+        for update_type in ("message", "callback_query", "pre_checkout_query"):
+            if update_type in update:
+                return update[update_type].get("from", {}).get("id")
+        return None
+
+    async def _drain_backlog(self, offset: Optional[int], parallel: bool = True) -> Optional[int]:
+        started = time.monotonic()
+        backlog: List[Dict[str, Any]] = []
+
+        while self.running.is_set():
+            updates = await self.get_updates(
+                offset=offset,
+                timeout=0,
+                allowed_updates=self.allowed_updates
+            )
+            if not updates:
+                break
+            backlog.extend(updates)
+            offset = updates[-1]["update_id"] + 1
+
+        fetched_in = time.monotonic() - started
+
+        if self.backlog_policy == BacklogPolicy.DROP_OLDER:
+            oldest = time.time() - self.backlog_max_age
+            kept = [
+                update for update in backlog
+                if update.get("message", {}).get("date", oldest) >= oldest
+            ]
+        elif self.backlog_policy == BacklogPolicy.LATEST_PER_CHAT:
+            latest: Dict[Any, Dict[str, Any]] = {}
+            for update in backlog:
+                chat_id = self._update_chat_id(update)
+                latest[chat_id if chat_id is not None else ("update", update["update_id"])] = update
+            kept = sorted(latest.values(), key=lambda update: update["update_id"])
+        else:
+            kept = backlog
+
+        if self.backlog_policy == BacklogPolicy.PARALLEL and parallel:
+            semaphore = asyncio.Semaphore(self.backlog_concurrency)
+
+            async def run_backlog_update(update: Dict[str, Any]):
+                async with semaphore:
+                    await self._run_update(UpdateWrapper(update))
+
+            backlog_tasks = []
+            for update in kept:
+                if self.deduplicator is not None and self.deduplicator.is_duplicate(update["update_id"]):
+                    continue
+                if self.offset_store is not None:
+                    self.offset_store.mark_fetched(update["update_id"])
+                backlog_tasks.append(run_backlog_update(update))
+            await asyncio.gather(*backlog_tasks, return_exceptions=True)
+        else:
+            for update in kept:
+                await self._enqueue_update(update)
+
+        if self.offset_store is not None:
+            kept_ids = {update["update_id"] for update in kept}
+            for update in backlog:
+                if update["update_id"] not in kept_ids:
+                    self.offset_store.mark_skipped(update["update_id"])
+            self.offset_store.flush()
+
+        self.backlog_report = {
+            "policy": self.backlog_policy.value,
+            "fetched": len(backlog),
+            "dispatched": len(kept),
+            "dropped": len(backlog) - len(kept),
+            "fetch_seconds": fetched_in,
+            "total_seconds": time.monotonic() - started
+        }
+        logger.info(
+            f"Backlog drained | Policy: {self.backlog_policy.value} | "
+            f"Fetched: {len(backlog)} | Dispatched: {len(kept)} | "
+            f"Fetch: {fetched_in:.2f}s | Total: {self.backlog_report['total_seconds']:.2f}s"
+        )
+        return offset
+
+    def _ordering_key(self, update: Dict[str, Any]) -> Optional[int]:
+        if self.ordering == "chat":
+            return self._update_chat_id(update)
+        if self.ordering == "user":
+            return self._update_user_id(update)
+        return None
+
+    @property
+    def lane_depths(self) -> Optional[Dict[str, int]]:
+        if self.priority_lanes is None:
+            return None
+        return self.priority_lanes.depths
+
+    async def _dispatch_updates(self):
+        if self.priority_lanes is not None:
+            await self._dispatch_lanes()
+            return
+
+        while True:
+            update_wrapper = await self.update_queue.get()
+            delay = 0.0
+            if self.rate_limiter is not None:
+                delay = self._admit(update_wrapper)
+                if delay is None:
+                    continue
+            await self._dispatch_update(update_wrapper, delay)
+
+    async def _dispatch_update(self, update_wrapper, delay: float = 0.0):
+        key = self._ordering_key(update_wrapper.update) if self.ordering else None
+
+        if key is not None:
+            if key in self.keyed_queues and await self._append_keyed(key, update_wrapper, delay):
+                return
+            self.keyed_queues[key] = deque()
+
+        if delay:
+            self._defer_update(delay, partial(self._start_update, key, update_wrapper))
+            return
+        await self._start_update(key, update_wrapper)
+
+    async def _start_update(self, key: Optional[int], update_wrapper):
+        await self.semaphore.acquire()
+        task = asyncio.create_task(self._run_queued(key, update_wrapper))
+        self.active_tasks.add(task)
+        task.add_done_callback(self._on_update_done)
+
+    def _admit(self, update_wrapper) -> Optional[float]:
+        delay = self.rate_limiter.check(update_wrapper.update)
+        if delay is None:
+            logger.debug(f"Rate limited update {update_wrapper.update_id}")
+            try:
+                if self.offset_store is not None:
+                    self.offset_store.mark_processed(update_wrapper.update_id)
+            finally:
+                self.update_queue.task_done()
+        return delay
+
+    def _defer_update(self, delay: float, start: Callable[[], Any]) -> None:
+        async def start_later():
+            await asyncio.sleep(delay)
+            await start()
+
+        task = asyncio.create_task(start_later())
+        self.active_tasks.add(task)
+        task.add_done_callback(self.active_tasks.discard)
+
+    async def _dispatch_lanes(self):
+        lanes = self.priority_lanes
+        if lanes.capacity is None:
+            lanes.capacity = self.queue_size
+        scheduler = asyncio.create_task(self._schedule_lanes())
+        try:
+            while True:
+                update_wrapper = await self.update_queue.get()
+                delay = 0.0
+                if self.rate_limiter is not None:
+                    delay = self._admit(update_wrapper)
+                    if delay is None:
+                        continue
+                await self._enqueue_lane(update_wrapper, delay)
+        finally:
+            scheduler.cancel()
+            await asyncio.gather(scheduler, return_exceptions=True)
+
+    async def _enqueue_lane(self, update_wrapper, delay: float = 0.0):
+        lanes = self.priority_lanes
+        key = self._ordering_key(update_wrapper.update) if self.ordering else None
+
+        if key is not None:
+            if key in self.keyed_queues and await self._append_keyed(key, update_wrapper, delay):
+                return
+            self.keyed_queues[key] = deque()
+
+        put = partial(lanes.put, lanes.lane_for(update_wrapper.update), (key, update_wrapper))
+        if delay:
+            self._defer_update(delay, put)
+            return
+        await put()
+
+    async def _schedule_lanes(self):
+        lanes = self.priority_lanes
+        while True:
+            lane, (key, update_wrapper) = await lanes.get()
+            task = asyncio.create_task(self._run_queued(key, update_wrapper))
+            self.active_tasks.add(task)
+            task.add_done_callback(partial(self._on_lane_done, lane))
+
+    def _on_lane_done(self, lane: str, task: asyncio.Task) -> None:
+        self.active_tasks.discard(task)
+        self.priority_lanes.release(lane)
+
+    async def _append_keyed(self, key: int, update_wrapper, delay: float = 0.0) -> bool:
+        while self.queue_size and self.keyed_depth >= self.queue_size:
+            self._keyed_room.clear()
+            await self._keyed_room.wait()
+
+        keyed_queue = self.keyed_queues.get(key)
+        if keyed_queue is None:
+            return False
+        ready_at = asyncio.get_running_loop().time() + delay if delay else None
+        keyed_queue.append((update_wrapper, ready_at))
+        self.keyed_depth += 1
+        return True
+
+    async def _run_queued(self, key: Optional[int], update_wrapper):
+        loop = asyncio.get_running_loop()
+        ready_at = None
+        try:
+            while True:
+                try:
+                    if ready_at is not None and ready_at > loop.time():
+                        await asyncio.sleep(ready_at - loop.time())
+                    await self._run_update(update_wrapper)
+                finally:
+                    self.update_queue.task_done()
+
+                if key is None or not self.keyed_queues[key]:
+                    break
+                update_wrapper, ready_at = self.keyed_queues[key].popleft()
+                self.keyed_depth -= 1
+                self._keyed_room.set()
+        finally:
+            if key is not None:
+                self.keyed_depth -= len(self.keyed_queues.pop(key))
+                self._keyed_room.set()
+
+    async def _run_update(self, update_wrapper):
+        try:
+            await self._handle_update(update_wrapper)
+        finally:
+            if self.offset_store is not None:
+                self.offset_store.mark_processed(update_wrapper.update_id)
+
+    def _on_update_done(self, task: asyncio.Task) -> None:
+        self.active_tasks.discard(task)
+        self.semaphore.release()
+
+    async def _run_pipeline(
+        self,
+        source: Callable[[], Any],
+        dispatch: Optional[Callable[[], Any]] = None
+    ):
+        self.update_queue = asyncio.Queue(maxsize=self.queue_size or 0)
+        dispatcher = asyncio.create_task((dispatch or self._dispatch_updates)())
+        try:
+            await source()
+            await self.update_queue.join()
+        finally:
+            dispatcher.cancel()
+            await asyncio.gather(dispatcher, return_exceptions=True)
+            if self.offset_store is not None:
+                self.offset_store.flush()
+
+    async def process_updates(self):
+        await self._run_pipeline(self._fetch_updates)
+
+    async def _handle_webhook_request(self, request: web.Request) -> web.Response:
+        if self.webhook_secret_token is not None:
+            received_token = request.headers.get("X-Telegram-Bot-Api-Secret-Token", "")
+            if not hmac.compare_digest(received_token, self.webhook_secret_token):
+                logger.warning(f"Rejected webhook request with invalid secret token from {request.remote}")
+                return web.Response(status=403)
+
+        try:
+            update = await request.json()
+        except Exception as e:
+            logger.error(f"Invalid webhook payload: {e}")
+            return web.Response(status=400)
+
+        if not isinstance(update, dict) or "update_id" not in update:
+            logger.error("Invalid webhook payload: missing update_id")
+            return web.Response(status=400)
+
+        if self.deduplicator is not None and self.deduplicator.is_duplicate(update["update_id"]):
+            logger.debug(f"Dropped duplicate update {update['update_id']}")
+            return web.Response(status=200)
+
+        try:
+            self.update_queue.put_nowait(UpdateWrapper(update))
+        except asyncio.QueueFull:
+            if self.deduplicator is not None:
+                self.deduplicator.forget(update["update_id"])
+            logger.warning(f"Update queue is full, asking server to redeliver update {update['update_id']}")
+            return web.Response(status=503)
+
+        return web.Response(status=200)
+
+    async def _serve_webhook(
+        self,
+        host: str,
+        port: int,
+        path: str,
+        reuse_port: Optional[bool] = None
+    ):
+        app = web.Application()
+        app.router.add_post(path, self._handle_webhook_request)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+
+        try:
+            site = web.TCPSite(runner, host, port, reuse_port=reuse_port)
+            await site.start()
+            logger.info(f"Webhook server listening on {host}:{port}{path}")
+
+            while self.running.is_set():
+                await asyncio.sleep(1)
+        finally:
+            await runner.cleanup()
+            logger.info("Webhook server closed.")
+
     def Initialize(self) -> Callable[[F], F]:
         def decorator(func: F) -> F:
             self.initialize_handlers.append(func)
@@ -714,6 +1316,246 @@ class Bot:
             loop.close()
 
     async def start_polling(self):
+        await self._run_service(self.process_updates)
+
+    async def start_webhook(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 8443,
+        path: str = "/",
+        secret_token: Optional[str] = None,
+        url: Optional[str] = None,
+        reuse_port: Optional[bool] = None
+    ):
+        self.webhook_secret_token = secret_token
+
+        async def serve():
+            if url is not None:
+                result = await self.set_webhook(url=url, secret_token=secret_token)
+                if not result.get("ok"):
+                    logger.error(f"Failed to set webhook: {result.get('description')}")
+                    return
+
+            await self._run_pipeline(
+                lambda: self._serve_webhook(host, port, path, reuse_port=reuse_port)
+            )
+
+        await self._run_service(serve)
+
+    def run_webhook(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 8443,
+        path: str = "/",
+        secret_token: Optional[str] = None,
+        url: Optional[str] = None,
+        reuse_port: Optional[bool] = None
+    ):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(
+                self.start_webhook(
+                    host,
+                    port,
+                    path,
+                    secret_token=secret_token,
+                    url=url,
+                    reuse_port=reuse_port
+                )
+            )
+        except KeyboardInterrupt:
+            self.running.clear()
+        finally:
+            loop.close()
+
+    def run_webhook_cluster(
+        self,
+        workers: Optional[int] = None,
+        host: str = "0.0.0.0",
+        port: int = 8443,
+        path: str = "/",
+        secret_token: Optional[str] = None,
+        url: Optional[str] = None
+    ):
+        if not hasattr(socket, "SO_REUSEPORT"):
+            raise RuntimeError("Webhook cluster requires SO_REUSEPORT support")
+        if self.running.is_set():
+            raise RuntimeError("Webhook cluster must be started before the bot is running")
+
+        workers = workers or os.cpu_count() or 1
+        context = multiprocessing.get_context("fork")
+        processes = []
+
+        for index in range(workers):
+            process = context.Process(
+                target=self.run_webhook,
+                args=(host, port, path),
+                kwargs={
+                    "secret_token": secret_token,
+                    "url": url if index == 0 else None,
+                    "reuse_port": True
+                },
+                name=f"balecore-webhook-{index}"
+            )
+            process.start()
+            processes.append(process)
+
+        logger.info(f"Webhook cluster started | Workers: {workers} | Address: {host}:{port}{path}")
+
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            logger.info("Stopping webhook cluster workers...")
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+            for process in processes:
+                process.join()
+            logger.info("Webhook cluster stopped.")
+
+    def run_sharded(self, workers: Optional[int] = None):
+        if self.running.is_set():
+            raise RuntimeError("Sharded mode must be started before the bot is running")
+
+        workers = workers or os.cpu_count() or 1
+        context = multiprocessing.get_context("fork")
+        ack_queue = context.Queue()
+        shard_queues = [context.Queue() for _ in range(workers)]
+        processes = []
+
+        for index, shard_queue in enumerate(shard_queues):
+            process = context.Process(
+                target=self._run_shard_worker,
+                args=(shard_queue, ack_queue),
+                name=f"balecore-shard-{index}"
+            )
+            process.start()
+            processes.append(process)
+
+        logger.info(f"Sharded dispatch started | Workers: {workers}")
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(
+                self._run_service(
+                    lambda: self._poll_shards(shard_queues, ack_queue),
+                    initialize=False
+                )
+            )
+        except KeyboardInterrupt:
+            self.running.clear()
+        finally:
+            for shard_queue in shard_queues:
+                shard_queue.put(None)
+            for process in processes:
+                process.join(timeout=30)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+            self._collect_shard_acks(ack_queue)
+            loop.close()
+            logger.info("Sharded dispatch stopped.")
+
+    async def _poll_shards(self, shard_queues: List[Any], ack_queue: Any):
+        loop = asyncio.get_running_loop()
+        in_flight = asyncio.Semaphore(self.queue_size or 1000)
+
+        async def read_acks():
+            while True:
+                try:
+                    update_id = await loop.run_in_executor(None, partial(ack_queue.get, timeout=1))
+                except queue.Empty:
+                    continue
+                if update_id is None:
+                    break
+                in_flight.release()
+                if self.offset_store is not None:
+                    self.offset_store.mark_processed(update_id)
+
+        async def dispatch_to_shards():
+            while True:
+                update_wrapper = await self.update_queue.get()
+                await in_flight.acquire()
+                chat_id = self._update_chat_id(update_wrapper.update)
+                shard_key = chat_id if chat_id is not None else update_wrapper.update_id
+                shard_queues[hash(shard_key) % len(shard_queues)].put(update_wrapper.update)
+                self.update_queue.task_done()
+
+        ack_reader = asyncio.create_task(read_acks())
+        try:
+            await self._run_pipeline(
+                partial(self._fetch_updates, parallel_backlog=False),
+                dispatch=dispatch_to_shards
+            )
+        finally:
+            ack_queue.put(None)
+            await asyncio.gather(ack_reader, return_exceptions=True)
+
+    def _collect_shard_acks(self, ack_queue: Any):
+        while True:
+            try:
+                update_id = ack_queue.get_nowait()
+            except Exception:
+                break
+            if update_id is not None and self.offset_store is not None:
+                self.offset_store.mark_processed(update_id)
+
+        if self.offset_store is not None:
+            self.offset_store.flush()
+
+    def _run_shard_worker(self, shard_queue: Any, ack_queue: Any):
+        self.offset_store = None
+        self.backlog_policy = None
+        self.polling_controller = None
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(
+                self._run_service(lambda: self._consume_shard(shard_queue, ack_queue))
+            )
+        except KeyboardInterrupt:
+            pass
+        finally:
+            loop.close()
+
+    async def _consume_shard(self, shard_queue: Any, ack_queue: Any):
+        loop = asyncio.get_running_loop()
+        chains: Dict[Any, asyncio.Task] = {}
+
+        async def run_in_order(update_wrapper, previous: Optional[asyncio.Task]):
+            if previous is not None:
+                await asyncio.wait([previous])
+            try:
+                await self._process_update(update_wrapper)
+            finally:
+                ack_queue.put(update_wrapper.update_id)
+
+        def release_chain(key: Any, task: asyncio.Task):
+            self.active_tasks.discard(task)
+            if chains.get(key) is task:
+                del chains[key]
+
+        while True:
+            update = await loop.run_in_executor(None, shard_queue.get)
+            if update is None:
+                break
+
+            chat_id = self._update_chat_id(update)
+            key = chat_id if chat_id is not None else ("update", update["update_id"])
+            task = asyncio.create_task(run_in_order(UpdateWrapper(update), chains.get(key)))
+            chains[key] = task
+            self.active_tasks.add(task)
+            task.add_done_callback(partial(release_chain, key))
+
+        if self.active_tasks:
+            await asyncio.gather(*self.active_tasks, return_exceptions=True)
+
+    async def _run_service(self, serve: Callable[[], Any], initialize: bool = True):
         if self.running.is_set():
             logger.warning("Bot is already running!")
             return
@@ -734,9 +1576,10 @@ class Bot:
                 logger.error("Please check your token and internet connection.")
                 return
 
-            await self.run_initialize_handlers()
+            if initialize:
+                await self.run_initialize_handlers()
 
-            await self.process_updates()
+            await serve()
 
         except asyncio.CancelledError:
             logger.info("Bot stopped by user (CancelledError).")
@@ -744,15 +1587,16 @@ class Bot:
             logger.info("Bot stopped by KeyboardInterrupt.")
             raise
         except Exception as e:
-            logger.exception(f"Unexpected error in polling loop: {e}")
+            logger.exception(f"Unexpected error in update loop: {e}")
         finally:
             self.running.clear()
             await self._close_session()
+            self._shutdown_executors()
         logger.info("Client session closed. Bot fully stopped.")
 
     def stop(self):
         self.running.clear()
-        asyncio.create_task(self.session.close())
+        asyncio.create_task(self._close_session())
         logger.info("Bot has been stopped.")
 
     async def schedule_message(
@@ -793,6 +1637,7 @@ class Bot:
                 json=params,
                 proxy=self.proxy,
                 headers={"Content-Type": "application/json"},
+                timeout=self._request_timeout()
             ) as response:
                 response_text = await response.text()
                 try:
@@ -843,6 +1688,7 @@ class Bot:
                 json=params,
                 proxy=self.proxy,
                 headers={"Content-Type": "application/json"},
+                timeout=self._request_timeout()
             ) as response:
                 response_text: str = await response.text()
                 try:
@@ -869,7 +1715,7 @@ class Bot:
             "chat_id": chat_id,
             "message_id": message_id
         }
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
             return response_data.get("ok", False)
 
@@ -882,7 +1728,7 @@ class Bot:
         params = {"chat_id": chat_id}
         if message_id is not None:
             params["message_id"] = message_id
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
             return response_data.get("ok", False)
 
@@ -892,7 +1738,7 @@ class Bot:
     ):
         url = f"{self.base_url}/bot{self.token}/unpinAllChatMessages"
         params = {"chat_id": chat_id}
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
             return response_data.get("ok", False)
 
@@ -912,7 +1758,7 @@ class Bot:
             if reply_to_message_id: payload["reply_to_message_id"] = reply_to_message_id
             if reply_markup: payload["reply_markup"] = reply_markup.to_dict()
 
-            async with self.session.post(url, json=payload, proxy=self.proxy) as resp:
+            async with self.session.post(url, json=payload, proxy=self.proxy, timeout=self._request_timeout()) as resp:
                 resp.raise_for_status()
                 return await resp.json()
 
@@ -938,7 +1784,7 @@ class Bot:
             content_type="application/octet-stream"
         )
 
-        async with self.session.post(url, data=form, proxy=self.proxy) as resp:
+        async with self.session.post(url, data=form, proxy=self.proxy, timeout=self._request_timeout()) as resp:
             resp.raise_for_status()
             result = await resp.json()
 
@@ -967,7 +1813,7 @@ class Bot:
             if reply_markup:
                 payload["reply_markup"] = reply_markup.to_dict()
 
-            async with self.session.post(url, json=payload, proxy=self.proxy) as resp:
+            async with self.session.post(url, json=payload, proxy=self.proxy, timeout=self._request_timeout()) as resp:
                 resp.raise_for_status()
                 return await resp.json()
 
@@ -996,7 +1842,7 @@ class Bot:
             content_type="application/octet-stream"
         )
 
-        async with self.session.post(url, data=form, proxy=self.proxy) as resp:
+        async with self.session.post(url, data=form, proxy=self.proxy, timeout=self._request_timeout()) as resp:
             resp.raise_for_status()
             result = await resp.json()
 
@@ -1020,7 +1866,7 @@ class Bot:
             params["reply_to_message_id"] = reply_to_message_id
         if reply_markup:
             params["reply_markup"] = reply_markup.to_dict()
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
 
     async def send_document(
@@ -1057,7 +1903,7 @@ class Bot:
                 content_type="application/octet-stream"
             )
 
-            async with self.session.post(url, data=form, proxy=self.proxy) as resp:
+            async with self.session.post(url, data=form, proxy=self.proxy, timeout=self._request_timeout()) as resp:
                 resp.raise_for_status()
                 return await resp.json()
 
@@ -1120,7 +1966,7 @@ class Bot:
                         content_type=content_type
                     )
 
-                    async with self.session.post(url, data=form, proxy=self.proxy) as resp:
+                    async with self.session.post(url, data=form, proxy=self.proxy, timeout=self._request_timeout()) as resp:
                         resp.raise_for_status()
                         result = await resp.json()
                         return result
@@ -1141,7 +1987,7 @@ class Bot:
                 if reply_markup:
                     payload["reply_markup"] = reply_markup.to_dict()
 
-                async with self.session.post(url, json=payload, proxy=self.proxy) as resp:
+                async with self.session.post(url, json=payload, proxy=self.proxy, timeout=self._request_timeout()) as resp:
                     resp.raise_for_status()
                     return await resp.json()
 
@@ -1165,7 +2011,7 @@ class Bot:
             params["reply_to_message_id"] = reply_to_message_id
         if reply_markup:
             params["reply_markup"] = reply_markup.to_dict()
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
 
     async def send_media_group(
@@ -1185,7 +2031,7 @@ class Bot:
         if reply_markup:
             params["reply_markup"] = reply_markup.to_dict()
 
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             return await response.json()
 
     async def send_photo(
@@ -1207,7 +2053,7 @@ class Bot:
             if reply_to_message_id: payload["reply_to_message_id"] = reply_to_message_id
             if reply_markup: payload["reply_markup"] = reply_markup.to_dict()
 
-            async with self.session.post(url, json=payload, proxy=self.proxy) as resp:
+            async with self.session.post(url, json=payload, proxy=self.proxy, timeout=self._request_timeout()) as resp:
                 resp.raise_for_status()
                 return await resp.json()
 
@@ -1244,7 +2090,7 @@ class Bot:
             content_type="application/octet-stream",
         )
 
-        async with self.session.post(url, data=form, proxy=self.proxy) as resp:
+        async with self.session.post(url, data=form, proxy=self.proxy, timeout=self._request_timeout()) as resp:
             resp.raise_for_status()
             result = await resp.json()
 
@@ -1273,7 +2119,7 @@ class Bot:
             if reply_to_message_id: payload["reply_to_message_id"] = reply_to_message_id
             if reply_markup: payload["reply_markup"] = reply_markup.to_dict()
 
-            async with self.session.post(url, json=payload, proxy=self.proxy) as resp:
+            async with self.session.post(url, json=payload, proxy=self.proxy, timeout=self._request_timeout()) as resp:
                 resp.raise_for_status()
                 return await resp.json()
 
@@ -1310,7 +2156,7 @@ class Bot:
             content_type="application/octet-stream",
         )
 
-        async with self.session.post(url, data=form, proxy=self.proxy) as resp:
+        async with self.session.post(url, data=form, proxy=self.proxy, timeout=self._request_timeout()) as resp:
             resp.raise_for_status()
             result = await resp.json()
 
@@ -1333,7 +2179,7 @@ class Bot:
             params["reply_to_message_id"] = reply_to_message_id
         if reply_markup:
             params["reply_markup"] = reply_markup.to_dict()
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
 
     async def send_sticker(
@@ -1362,7 +2208,7 @@ class Bot:
             if emoji:
                 payload["emoji"] = emoji
 
-            async with self.session.post(url, json=payload, proxy=self.proxy) as response:
+            async with self.session.post(url, json=payload, proxy=self.proxy, timeout=self._request_timeout()) as response:
                 response.raise_for_status()
                 return await response.json()
 
@@ -1439,7 +2285,7 @@ class Bot:
                 content_type="image/webp"
             )
 
-            async with self.session.post(url, data=form, proxy=self.proxy) as response:
+            async with self.session.post(url, data=form, proxy=self.proxy, timeout=self._request_timeout()) as response:
                 response.raise_for_status()
                 return await response.json()
 
@@ -1472,7 +2318,7 @@ class Bot:
         url = f"{self.base_url}/bot{self.token}/sendChatAction"
         params = {"chat_id": chat_id, "action": action}
 
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
             return response_data
 
@@ -1487,7 +2333,7 @@ class Bot:
         params = {"chat_id": chat_id, "message_id": message_id, "text": text}
         if reply_markup:
             params["reply_markup"] = reply_markup.to_dict()
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
             return response_data
 
@@ -1498,7 +2344,7 @@ class Bot:
     ):
         url = f"{self.base_url}/bot{self.token}/deleteMessage"
         params = {"chat_id": chat_id, "message_id": message_id}
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
             return response_data
 
@@ -1510,7 +2356,7 @@ class Bot:
     ):
         url = f"{self.base_url}/bot{self.token}/forwardMessage"
         params = {"chat_id": chat_id, "from_chat_id": from_chat_id, "message_id": message_id}
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
             return response_data
 
@@ -1520,7 +2366,7 @@ class Bot:
         ) -> tuple[AdminInfo, ...]:
             url = f"{self.base_url}/bot{self.token}/getChatAdministrators"
             params = {"chat_id": chat_id}
-            async with self.session.post(url, json=params, proxy=self.proxy) as response:
+            async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
                 response_data = await response.json()
                 if response_data.get("ok"):
                     admins = []
@@ -1563,7 +2409,7 @@ class Bot:
         params = {"chat_id": chat_id, "user_id": user_id}
 
         try:
-            async with self.session.post(url, json=params, proxy=self.proxy) as response:
+            async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
                 response_data = await response.json()
 
                 if not response_data.get("ok"):
@@ -1599,7 +2445,7 @@ class Bot:
     ) -> tuple:
         url = f"{self.base_url}/bot{self.token}/getChatMembersCount"
         params = {"chat_id": chat_id}
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
             if response_data.get("ok"):
                 return (response_data["result"],)
@@ -1611,7 +2457,7 @@ class Bot:
     ) -> tuple:
         url = f"{self.base_url}/bot{self.token}/getFile"
         params = {"file_id": file_id}
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
             if response_data.get("ok"):
                 result = response_data["result"]
@@ -1629,7 +2475,7 @@ class Bot:
     ) -> tuple:
         url = f"{self.base_url}/bot{self.token}/getStickerSet"
         params = {"name": name}
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
             if response_data.get("ok"):
                 result = response_data["result"]
@@ -1664,7 +2510,7 @@ class Bot:
     ):
         url = f"{self.base_url}/bot{self.token}/inviteUser"
         params = {"chat_id": chat_id, "user_id": user_id}
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
             return response_data
 
@@ -1674,7 +2520,7 @@ class Bot:
     ):
         url = f"{self.base_url}/bot{self.token}/leaveChat"
         params = {"chat_id": chat_id}
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
             return response_data
 
@@ -1720,7 +2566,7 @@ class Bot:
         if can_manage_topics is not None:
             params["can_manage_topics"] = can_manage_topics
 
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
             if not response_data.get("ok"):
                 logger.error(f"Failed to promote chat member: {response_data.get('description')}")
@@ -1744,7 +2590,7 @@ class Bot:
         if can_pin_messages is not None:
             params["can_pin_messages"] = can_pin_messages
 
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             try:
                 response_data = await response.json()
                 if not response_data.get("ok"):
@@ -1771,7 +2617,7 @@ class Bot:
                 "photo": photo
             }
 
-            async with self.session.post(url, json=params, proxy=self.proxy) as response:
+            async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
                 response.raise_for_status()
                 return await response.json()
 
@@ -1814,7 +2660,7 @@ class Bot:
                 content_type="image/jpeg"
             )
 
-            async with self.session.post(url, data=form, proxy=self.proxy) as response:
+            async with self.session.post(url, data=form, proxy=self.proxy, timeout=self._request_timeout()) as response:
                 response.raise_for_status()
                 return await response.json()
 
@@ -1829,7 +2675,7 @@ class Bot:
     ):
         url = f"{self.base_url}/bot{self.token}/banChatMember"
         params = {"chat_id": chat_id, "user_id": user_id}
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
             return response_data
 
@@ -1840,7 +2686,7 @@ class Bot:
     ):
         url = f"{self.base_url}/bot{self.token}/unbanChatMember"
         params = {"chat_id": chat_id, "user_id": user_id}
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
             return response_data
 
@@ -1867,7 +2713,7 @@ class Bot:
         if reply_markup is not None:
             params["reply_markup"] = reply_markup.to_dict()
 
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data: Dict[str, Any] = await response.json()
             return response_data
 
@@ -1891,7 +2737,7 @@ class Bot:
             if mask_position:
                 params["mask_position"] = mask_position
 
-            async with self.session.post(url, json=params, proxy=self.proxy) as response:
+            async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
                 response.raise_for_status()
                 return await response.json()
 
@@ -1938,7 +2784,7 @@ class Bot:
                 content_type="image/png"
             )
 
-            async with self.session.post(url, data=form, proxy=self.proxy) as response:
+            async with self.session.post(url, data=form, proxy=self.proxy, timeout=self._request_timeout()) as response:
                 response.raise_for_status()
                 return await response.json()
 
@@ -1979,7 +2825,7 @@ class Bot:
             if mask_position:
                 params["mask_position"] = mask_position
 
-            async with self.session.post(url, json=params, proxy=self.proxy) as response:
+            async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
                 response.raise_for_status()
                 return await response.json()
 
@@ -2041,7 +2887,7 @@ class Bot:
                 content_type=content_type
             )
 
-            async with self.session.post(url, data=form, proxy=self.proxy) as response:
+            async with self.session.post(url, data=form, proxy=self.proxy, timeout=self._request_timeout()) as response:
                 response.raise_for_status()
                 return await response.json()
 
@@ -2069,7 +2915,7 @@ class Bot:
                 sticker_field: sticker
             }
 
-            async with self.session.post(url, json=params, proxy=self.proxy) as response:
+            async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
                 response.raise_for_status()
                 return await response.json()
 
@@ -2122,7 +2968,7 @@ class Bot:
                 content_type=content_type
             )
 
-            async with self.session.post(url, data=form, proxy=self.proxy) as response:
+            async with self.session.post(url, data=form, proxy=self.proxy, timeout=self._request_timeout()) as response:
                 response.raise_for_status()
                 return await response.json()
 
@@ -2142,7 +2988,7 @@ class Bot:
             params["expire_date"] = expire_date
         if member_limit:
             params["member_limit"] = member_limit
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
 
     async def delete_chat_photo(
@@ -2151,7 +2997,7 @@ class Bot:
     ):
         url = f"{self.base_url}/bot{self.token}/deleteChatPhoto"
         params = {"chat_id": chat_id}
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
 
     async def delete_sticker_from_set(
@@ -2160,7 +3006,7 @@ class Bot:
     ):
         url = f"{self.base_url}/bot{self.token}/deleteStickerFromSet"
         params = {"sticker": sticker}
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
 
     async def edit_message_caption(
@@ -2174,7 +3020,7 @@ class Bot:
         params = {"chat_id": chat_id, "message_id": message_id, "caption": caption}
         if reply_markup:
             params["reply_markup"] = reply_markup.to_dict()
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
 
     async def export_chat_invite_link(
@@ -2183,7 +3029,7 @@ class Bot:
     ):
         url = f"{self.base_url}/bot{self.token}/exportChatInviteLink"
         params = {"chat_id": chat_id}
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
 
     async def revoke_chat_invite_link(
@@ -2193,7 +3039,7 @@ class Bot:
     ):
         url = f"{self.base_url}/bot{self.token}/revokeChatInviteLink"
         params = {"chat_id": chat_id, "invite_link": invite_link}
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
 
     async def set_chat_description(
@@ -2203,7 +3049,7 @@ class Bot:
     ):
         url = f"{self.base_url}/bot{self.token}/setChatDescription"
         params = {"chat_id": chat_id, "description": description}
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
 
     async def set_chat_title(
@@ -2213,14 +3059,17 @@ class Bot:
     ):
         url = f"{self.base_url}/bot{self.token}/setChatTitle"
         params = {"chat_id": chat_id, "title": title}
-        async with self.session.post(url, json=params, proxy=self.proxy) as response:
+        async with self.session.post(url, json=params, proxy=self.proxy, timeout=self._request_timeout()) as response:
             response_data = await response.json()
 
     def CallbackQuery(
         self,
         __filter: Optional[Union[Callable[[Any], bool],
                         Sequence[Callable[[Any], bool]],
-                        re_Pattern[str]]] = None
+                        re_Pattern[str]]] = None,
+        *,
+        timeout: Optional[float] = None,
+        cpu_bound: bool = False
     ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
         chosen_filter: Union[Callable[[Any], bool],
                         Sequence[Callable[[Any], bool]],
@@ -2253,10 +3102,13 @@ class Bot:
                     f"Got {type(chosen_filter).__name__}"
                 )
 
-            self.callback_handlers.append({
+            self._register_handler(self.callback_handlers, {
                 "filter": actual_filter,
                 "func": fn,
-                "original_filter": chosen_filter
+                "original_filter": chosen_filter,
+                "update_type": "callback_query",
+                "timeout": timeout,
+                "cpu_bound": cpu_bound
             })
             return fn
 
@@ -2270,7 +3122,10 @@ class Bot:
         self,
         __filter: Optional[Union[Callable[[Any], bool],
                         Sequence[Callable[[Any], bool]],
-                        re_Pattern[str]]] = None
+                        re_Pattern[str]]] = None,
+        *,
+        timeout: Optional[float] = None,
+        cpu_bound: bool = False
     ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
         chosen_filter: Union[Callable[[Any], bool],
                         Sequence[Callable[[Any], bool]],
@@ -2303,10 +3158,13 @@ class Bot:
                     f"Got {type(chosen_filter).__name__}"
                 )
 
-            self.callback_handlers.append({
+            self._register_handler(self.callback_handlers, {
                 "filter": actual_filter,
                 "func": fn,
-                "original_filter": chosen_filter
+                "original_filter": chosen_filter,
+                "update_type": "callback_query",
+                "timeout": timeout,
+                "cpu_bound": cpu_bound
             })
             return fn
 
@@ -2325,12 +3183,19 @@ class Bot:
         return decorator
 
     def PreCheckoutQuery(
-        self
-        ) -> Callable:
+        self,
+        timeout: Optional[float] = None,
+        auto_answer: bool = True,
+        error_message: str = "Payment could not be confirmed in time"
+    ) -> Callable:
         def decorator(func: Callable) -> Callable:
-            self.callback_handlers.append({
+            self._register_handler(self.pre_checkout_handlers, {
                 "filter": self.filters.pre_checkout_query,
-                "func": func
+                "func": func,
+                "update_type": "pre_checkout_query",
+                "timeout": timeout,
+                "auto_answer": auto_answer,
+                "error_message": error_message
             })
             return func
         return decorator
@@ -2399,7 +3264,7 @@ class Bot:
                     url,
                     json=params,
                     proxy=self.proxy,
-                    timeout=aiohttp.ClientTimeout(total=30)
+                    timeout=self._request_timeout(30)
                 ) as response:
                     response.raise_for_status()
                     return await response.json()
@@ -2427,7 +3292,7 @@ class Bot:
             content_type="image/jpeg"
         )
 
-        async with self.session.post(url, data=form, proxy=self.proxy) as resp:
+        async with self.session.post(url, data=form, proxy=self.proxy, timeout=self._request_timeout()) as resp:
             resp.raise_for_status()
             return await resp.json()
 
@@ -2457,7 +3322,7 @@ class Bot:
                 url,
                 json=params,
                 proxy=self.proxy,
-                timeout=aiohttp.ClientTimeout(total=10)
+                timeout=self._request_timeout(10)
             ) as response:
                 response.raise_for_status()
                 result = await response.json()
@@ -2488,7 +3353,7 @@ class Bot:
                 url,
                 json=params,
                 proxy=self.proxy,
-                timeout=aiohttp.ClientTimeout(total=timeout)
+                timeout=self._request_timeout(timeout)
             ) as response:
 
                 if response.status != 200:
@@ -2525,38 +3390,30 @@ class Bot:
         seconds: Union[int, float],
         text: Optional[str] = None,
     ) -> Callable:
+        if seconds <= 0:
+            return lambda func: func
+
+        limiter = RateLimiter(rate=1, per=seconds, burst=1)
+
         def decorator(func: Callable) -> Callable:
             @wraps(func)
             async def wrapper(*args, **kwargs) -> Any:
-                message = None
-                user_id = None
-
-                if 'message' in kwargs:
-                    message = kwargs['message']
-                elif 'update' in kwargs and hasattr(kwargs['update'], 'message'):
-                    message = kwargs['update'].message
-
-                for arg in args:
-                    if isinstance(arg, Message):
-                        message = arg
-                        break
-
-                if message and hasattr(message, 'from_user') and hasattr(message.from_user, 'id'):
-                    user_id = message.from_user.id
+                message = kwargs.get('message')
+                if message is None:
+                    message = next((arg for arg in args if isinstance(arg, Message)), None)
 
-                if user_id:
-                    if text and message and hasattr(message, 'chat') and hasattr(message.chat, 'id'):
+                user_id = message.from_user.id if message is not None and message.from_user else None
+                if user_id is not None and limiter.reserve(user_id) is None:
+                    if text and message.chat is not None:
                         try:
-                            wait = await self.send_message(
+                            await self.send_message(
                                 chat_id=message.chat.id,
                                 text=text,
-                                reply_to_message_id=message.message_id if hasattr(message, 'message_id') else None
+                                reply_to_message_id=message.message_id
                             )
                         except Exception as e:
                             logger.warning(f"Failed to send sleep message: {e}")
-
-                    await asyncio.sleep(seconds)
-                    await self.delete_message(chat_id=message.chat.id, message_id=wait.message_id)
+                    return None
 
                 return await func(*args, **kwargs)
 
@@ -2570,27 +3427,24 @@ class Bot:
         text: Optional[str] = None,
         show_alert: bool = False
     ) -> Callable:
+        if seconds <= 0:
+            return lambda func: func
+
+        limiter = RateLimiter(rate=1, per=seconds, burst=1)
+
         def decorator(func: Callable) -> Callable:
             @wraps(func)
             async def wrapper(*args, **kwargs) -> Any:
-                callback_query = None
-                user_id = None
-
-                if 'callback_query' in kwargs:
-                    callback_query = kwargs['callback_query']
-                elif 'update' in kwargs and hasattr(kwargs['update'], 'callback_query'):
-                    callback_query = kwargs['update'].callback_query
-
-                for arg in args:
-                    if hasattr(arg, 'data') and hasattr(arg, 'from_user'):
-                        callback_query = arg
-                        break
-
-                if callback_query and hasattr(callback_query, 'from_user') and hasattr(callback_query.from_user, 'id'):
-                    user_id = callback_query.from_user.id
+                callback_query = kwargs.get('callback_query')
+                if callback_query is None:
+                    callback_query = next(
+                        (arg for arg in args if hasattr(arg, 'data') and hasattr(arg, 'from_user')),
+                        None
+                    )
 
-                if user_id:
-                    if text and callback_query and hasattr(callback_query, 'id'):
+                user_id = callback_query.from_user.id if callback_query is not None and callback_query.from_user else None
+                if user_id is not None and limiter.reserve(user_id) is None:
+                    if text:
                         try:
                             await self.answer_callback_query(
                                 callback_query_id=callback_query.id,
@@ -2599,8 +3453,7 @@ class Bot:
                             )
                         except Exception as e:
                             logger.warning(f"Failed to answer callback query: {e}")
-
-                    await asyncio.sleep(seconds)
+                    return None
 
                 return await func(*args, **kwargs)
 
@@ -0,0 +1,71 @@
+import aiohttp
+import asyncio
+from typing import List, Optional, Sequence
+
+from .bot import Bot
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class BotRunner:
+    def __init__(
+        self,
+        bots: Optional[Sequence[Bot]] = None,
+        concurrency_limit: int = 120,
+        connection_limit: int = 100
+    ) -> None:
+        self.bots: List[Bot] = list(bots) if bots else []
+        self.concurrency_limit = concurrency_limit
+        self.connection_limit = connection_limit
+        self.semaphore = asyncio.Semaphore(concurrency_limit)
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    def add_bot(self, bot: Bot) -> Bot:
+        self.bots.append(bot)
+        return bot
+
+    async def start_polling(self):
+        if not self.bots:
+            logger.warning("No bots registered in runner.")
+            return
+
+        connector = aiohttp.TCPConnector(limit=self.connection_limit)
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+
+        for bot in self.bots:
+            bot.session = self.session
+            bot.semaphore = self.semaphore
+
+        logger.info(f"Runner started | Bots: {len(self.bots)} | Concurrency: {self.concurrency_limit}")
+
+        try:
+            results = await asyncio.gather(
+                *(bot.start_polling() for bot in self.bots),
+                return_exceptions=True
+            )
+            for bot, result in zip(self.bots, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Bot {bot.token[:8]}... stopped with error: {result}")
+        finally:
+            await self.session.close()
+            logger.info("Runner session closed. All bots stopped.")
+
+    @property
+    def start(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self.start_polling())
+        except KeyboardInterrupt:
+            self.stop()
+        finally:
+            loop.close()
+
+    def stop(self):
+        for bot in self.bots:
+            bot.running.clear()
+        logger.info("Runner has been stopped.")
@@ -0,0 +1,75 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class _TrieNode:
+    __slots__ = ("children", "handlers")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.handlers: List[Dict] = []
+
+
+class CallbackRouter:
+    def __init__(self, handlers: List[Dict]) -> None:
+        self.handlers = handlers
+        self._exact: Dict[str, List[Dict]] = {}
+        self._root = _TrieNode()
+        self._fallback: List[Tuple[Dict, Optional[str]]] = []
+        self._size = -1
+
+    def rebuild(self) -> None:
+        exact: Dict[str, List[Dict]] = {}
+        root = _TrieNode()
+        fallback: List[Tuple[Dict, Optional[str]]] = []
+
+        for handler in self.handlers:
+            handler_filter = handler["filter"]
+            callback_data = getattr(handler_filter, "callback_data", None)
+            callback_prefix = getattr(handler_filter, "callback_prefix", None)
+
+            if callback_data is not None:
+                exact.setdefault(callback_data, []).append(handler)
+            elif callback_prefix is not None:
+                node = root
+                for char in callback_prefix:
+                    node = node.children.setdefault(char, _TrieNode())
+                node.handlers.append(handler)
+            else:
+                fallback.append((handler, None))
+
+        self._exact = exact
+        self._root = root
+        self._fallback = fallback
+        self._size = len(self.handlers)
+
+    def candidates(self, data: Optional[str]) -> List[Tuple[Dict, Optional[str]]]:
+        if self._size != len(self.handlers):
+            self.rebuild()
+
+        if data is None:
+            return self._fallback
+
+        matches: List[Tuple[Dict, Optional[str]]] = [
+            (handler, "") for handler in self._exact.get(data, ())
+        ]
+
+        node = self._root
+        depths: List[Tuple[int, List[Dict]]] = []
+        if node.handlers:
+            depths.append((0, node.handlers))
+        for depth, char in enumerate(data, 1):
+            node = node.children.get(char)
+            if node is None:
+                break
+            if node.handlers:
+                depths.append((depth, node.handlers))
+
+        for depth, handlers in reversed(depths):
+            suffix = data[depth:]
+            matches.extend((handler, suffix) for handler in handlers)
+
+        if not matches:
+            return self._fallback
+
+        matches.extend(self._fallback)
+        return matches
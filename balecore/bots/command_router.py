@@ -0,0 +1,71 @@
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..filters.filters import parse_command
+from ..filters.pattern_set import PatternSet
+
+
+class CommandRouter:
+    def __init__(self, handlers: List[Dict], pattern_set: Optional[PatternSet] = None) -> None:
+        self.handlers = handlers
+        self.pattern_set = pattern_set
+        self._pruned: Dict[Tuple[int, Optional[int]], List[Dict]] = {}
+        self._has_patterns = False
+        self._routes: Dict[str, List[Dict]] = {}
+        self._fallback: List[Dict] = []
+        self._size = -1
+
+    def rebuild(self) -> None:
+        command_indexes: Dict[str, List[int]] = defaultdict(list)
+        fallback_indexes: List[int] = []
+
+        for index, handler in enumerate(self.handlers):
+            commands = getattr(handler["filter"], "commands", None)
+            if commands:
+                for command in commands:
+                    command_indexes[command].append(index)
+            else:
+                fallback_indexes.append(index)
+
+        self._fallback = [self.handlers[index] for index in fallback_indexes]
+        self._routes = {
+            command: [self.handlers[index] for index in sorted(indexes + fallback_indexes)]
+            for command, indexes in command_indexes.items()
+        }
+        self._pruned = {}
+        self._has_patterns = any(
+            getattr(handler["filter"], "pattern_slot", None) is not None
+            for handler in self.handlers
+        )
+        self._size = len(self.handlers)
+
+    def candidates(self, update: Dict[str, Any]) -> List[Dict]:
+        if self._size != len(self.handlers):
+            self.rebuild()
+
+        text = update.get("message", {}).get("text")
+        if not isinstance(text, str):
+            return self._fallback
+
+        handlers = self._fallback
+        parsed = parse_command(text.lstrip())
+        if parsed is not None:
+            handlers = self._routes.get(parsed[0], self._fallback)
+
+        if not self._has_patterns or self.pattern_set is None:
+            return handlers
+        return self._prune(handlers, self.pattern_set.first_match_cached(update, text))
+
+    def _prune(self, handlers: List[Dict], first: Optional[int]) -> List[Dict]:
+        cache_key = (id(handlers), first)
+        pruned = self._pruned.get(cache_key)
+        if pruned is None:
+            pruned = self._pruned[cache_key] = [
+                handler for handler in handlers
+                if not _skipped(getattr(handler["filter"], "pattern_slot", None), first)
+            ]
+        return pruned
+
+
+def _skipped(slot: Optional[int], first: Optional[int]) -> bool:
+    return slot is not None and (first is None or slot < first)
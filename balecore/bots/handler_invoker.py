@@ -0,0 +1,171 @@
+import asyncio
+import contextvars
+import inspect
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+def _from_user(update_wrapper: Any) -> Optional[Any]:
+    if update_wrapper.message is not None:
+        return update_wrapper.message.from_user
+    if update_wrapper.callback_query is not None:
+        return update_wrapper.callback_query.from_user
+    if update_wrapper.pre_checkout_query is not None:
+        return update_wrapper.pre_checkout_query.from_user
+    return None
+
+
+def _chat(update_wrapper: Any) -> Optional[Any]:
+    if update_wrapper.message is not None:
+        return update_wrapper.message.chat
+    if update_wrapper.callback_query is not None and update_wrapper.callback_query.message is not None:
+        return update_wrapper.callback_query.message.chat
+    return None
+
+
+def _user_state(bot: Any, update_wrapper: Any) -> Optional[str]:
+    from_user = _from_user(update_wrapper)
+    if from_user is None or from_user.id is None:
+        return None
+    return bot.get_user_state(from_user.id)
+
+
+def _filter_result(update_wrapper: Any, name: str) -> Any:
+    results = update_wrapper.filter_results
+    return None if results is None else results.get(name)
+
+
+HANDLER_ARGUMENTS: Dict[str, Callable[[Any, Any], Any]] = {
+    "bot": lambda bot, update_wrapper: bot,
+    "update": lambda bot, update_wrapper: update_wrapper.update,
+    "message": lambda bot, update_wrapper: (
+        update_wrapper.message
+        if update_wrapper.message is not None or update_wrapper.callback_query is None
+        else update_wrapper.callback_query.message
+    ),
+    "callback_query": lambda bot, update_wrapper: update_wrapper.callback_query,
+    "pre_checkout_query": lambda bot, update_wrapper: update_wrapper.pre_checkout_query,
+    "suffix": lambda bot, update_wrapper: (
+        update_wrapper.callback_query.suffix
+        if update_wrapper.callback_query is not None
+        else None
+    ),
+    "from_user": lambda bot, update_wrapper: _from_user(update_wrapper),
+    "chat": lambda bot, update_wrapper: _chat(update_wrapper),
+    "user_state": _user_state,
+    "matched_keywords": lambda bot, update_wrapper: _filter_result(update_wrapper, "matched_keywords"),
+    "match": lambda bot, update_wrapper: _filter_result(update_wrapper, "match"),
+}
+
+
+PARENT_ARGUMENTS = ("user_state", "suffix", "matched_keywords")
+
+
+class ThreadBot:
+    def __init__(self, bot: Any, loop: asyncio.AbstractEventLoop) -> None:
+        self._bot = bot
+        self._loop = loop
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._bot, name)
+        if not inspect.iscoroutinefunction(attribute):
+            return attribute
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return asyncio.run_coroutine_threadsafe(attribute(*args, **kwargs), self._loop).result()
+
+        return call
+
+
+class DeferredBot:
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        from .bot import Bot
+
+        if not inspect.iscoroutinefunction(getattr(Bot, name, None)):
+            raise AttributeError(f"Bot API method {name} is not available in a cpu_bound handler")
+
+        def call(*args: Any, **kwargs: Any) -> None:
+            self.calls.append((name, args, kwargs))
+
+        return call
+
+
+def run_cpu_bound(
+    func: Callable[..., Any],
+    update: Dict[str, Any],
+    names: Tuple[str, ...],
+    resolved: Dict[str, Any]
+) -> Tuple[Any, List[Tuple[str, tuple, dict]]]:
+    from ..updates.update_wrapper import UpdateWrapper
+
+    bot = DeferredBot()
+    update_wrapper = UpdateWrapper(update)
+    kwargs = dict(resolved)
+    for name in names:
+        if name not in kwargs:
+            kwargs[name] = HANDLER_ARGUMENTS[name](bot, update_wrapper)
+    return func(**kwargs), bot.calls
+
+
+def _thread_invoker(bot: Any, func: Callable[..., Any], resolvers: tuple) -> Callable[[Any], Awaitable[Any]]:
+    async def invoke(update_wrapper: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        thread_bot = ThreadBot(bot, loop)
+        kwargs = {
+            name: thread_bot if name == "bot" else resolve(bot, update_wrapper)
+            for name, resolve in resolvers
+        }
+        context = contextvars.copy_context()
+        result = await loop.run_in_executor(bot.thread_executor, partial(context.run, func, **kwargs))
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    return invoke
+
+
+def _process_invoker(bot: Any, func: Callable[..., Any], names: Tuple[str, ...]) -> Callable[[Any], Awaitable[Any]]:
+    parent_names = tuple(name for name in names if name in PARENT_ARGUMENTS)
+
+    async def invoke(update_wrapper: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        resolved = {name: HANDLER_ARGUMENTS[name](bot, update_wrapper) for name in parent_names}
+        result, calls = await loop.run_in_executor(
+            bot.process_executor,
+            partial(run_cpu_bound, func, update_wrapper.update, names, resolved)
+        )
+        for name, args, kwargs in calls:
+            await getattr(bot, name)(*args, **kwargs)
+        return result
+
+    return invoke
+
+
+def build_invoker(
+    bot: Any,
+    func: Callable[..., Awaitable[Any]],
+    cpu_bound: bool = False
+) -> Callable[[Any], Awaitable[Any]]:
+    names = tuple(
+        name for name in inspect.signature(func).parameters
+        if name in HANDLER_ARGUMENTS
+    )
+    resolvers = tuple((name, HANDLER_ARGUMENTS[name]) for name in names)
+
+    if cpu_bound:
+        if inspect.iscoroutinefunction(func):
+            raise TypeError(f"cpu_bound handler {func.__name__} must be a regular function, not a coroutine function")
+        return _process_invoker(bot, func, names)
+    if not inspect.iscoroutinefunction(func):
+        return _thread_invoker(bot, func, resolvers)
+
+    if not resolvers:
+        return lambda update_wrapper: func()
+
+    def invoke(update_wrapper: Any) -> Awaitable[Any]:
+        return func(**{name: resolve(bot, update_wrapper) for name, resolve in resolvers})
+
+    return invoke
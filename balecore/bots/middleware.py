@@ -0,0 +1,36 @@
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+MIDDLEWARE_STAGES = ("pre_filter", "pre_handler", "post_handler")
+
+
+def compose_middleware(middlewares: List[Callable[..., Awaitable[Any]]]) -> Optional[Callable[..., Awaitable[Any]]]:
+    if not middlewares:
+        return None
+    if len(middlewares) == 1:
+        return middlewares[0]
+
+    chain = tuple(middlewares)
+
+    async def composed(*args: Any) -> Optional[bool]:
+        for middleware in chain:
+            if await middleware(*args) is False:
+                return False
+        return None
+
+    return composed
+
+
+def wrap_invoker(
+    handler: Dict,
+    invoke: Callable[[Any], Awaitable[Any]],
+    post_handler: Optional[Callable[..., Awaitable[Any]]]
+) -> Callable[[Any], Awaitable[Any]]:
+    if post_handler is None:
+        return invoke
+
+    async def invoke_with_middleware(update_wrapper: Any) -> Any:
+        result = await invoke(update_wrapper)
+        await post_handler(update_wrapper, handler, result)
+        return result
+
+    return invoke_with_middleware
@@ -0,0 +1,173 @@
+import asyncio
+import heapq
+import os
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from typing import List, Optional, Set, Tuple
+
+
+class OffsetStore(ABC):
+    def __init__(
+        self,
+        commit_every: int = 100,
+        commit_interval: float = 1.0,
+        max_in_flight: int = 0
+    ) -> None:
+        self.commit_every = commit_every
+        self.commit_interval = commit_interval
+        self.max_in_flight = max_in_flight
+        self.fetched: Optional[int] = None
+        self.committed: Optional[int] = None
+        self._persisted: Optional[int] = None
+        self._pending: Set[int] = set()
+        self._pending_heap: List[int] = []
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+        self._room = asyncio.Event()
+
+    @property
+    def watermark(self) -> Tuple[Optional[int], Optional[int]]:
+        return self.committed, self.fetched
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    async def wait_for_window(self) -> None:
+        while len(self._pending) > self.max_in_flight:
+            self._room.clear()
+            await self._room.wait()
+
+    def load(self) -> Optional[int]:
+        self.committed = self._read()
+        self._persisted = self.committed
+        self.fetched = self.committed
+        return self.committed
+
+    def mark_fetched(self, update_id: int) -> None:
+        if self.fetched is None or update_id > self.fetched:
+            self.fetched = update_id
+        self._pending.add(update_id)
+        heapq.heappush(self._pending_heap, update_id)
+
+    def mark_skipped(self, update_id: int) -> None:
+        if self.fetched is None or update_id > self.fetched:
+            self.fetched = update_id
+        if not self._pending:
+            self.committed = self.fetched
+
+    def mark_processed(self, update_id: int) -> None:
+        if update_id not in self._pending:
+            return
+
+        self._pending.discard(update_id)
+        while self._pending_heap and self._pending_heap[0] not in self._pending:
+            heapq.heappop(self._pending_heap)
+
+        self.committed = (
+            self._pending_heap[0] - 1
+            if self._pending_heap else
+            self.fetched
+        )
+        self._uncommitted += 1
+        self._room.set()
+        self.commit()
+
+    def commit(self) -> None:
+        if (
+            self._uncommitted >= self.commit_every
+            or time.monotonic() - self._last_commit >= self.commit_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        if self.committed is not None and self.committed != self._persisted:
+            self._write(self.committed)
+            self._persisted = self.committed
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+
+    def close(self) -> None:
+        self.flush()
+
+    @abstractmethod
+    def _read(self) -> Optional[int]:
+        ...
+
+    @abstractmethod
+    def _write(self, update_id: int) -> None:
+        ...
+
+
+class FileOffsetStore(OffsetStore):
+    def __init__(
+        self,
+        path: str,
+        commit_every: int = 100,
+        commit_interval: float = 1.0,
+        max_in_flight: int = 0
+    ) -> None:
+        super().__init__(
+            commit_every=commit_every,
+            commit_interval=commit_interval,
+            max_in_flight=max_in_flight
+        )
+        self.path = path
+
+    def _read(self) -> Optional[int]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                content = f.read().strip()
+        except FileNotFoundError:
+            return None
+        return int(content) if content else None
+
+    def _write(self, update_id: int) -> None:
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(str(update_id))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+
+class SQLiteOffsetStore(OffsetStore):
+    def __init__(
+        self,
+        path: str,
+        key: str = "default",
+        commit_every: int = 100,
+        commit_interval: float = 1.0,
+        max_in_flight: int = 0
+    ) -> None:
+        super().__init__(
+            commit_every=commit_every,
+            commit_interval=commit_interval,
+            max_in_flight=max_in_flight
+        )
+        self.path = path
+        self.key = key
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS offsets (key TEXT PRIMARY KEY, update_id INTEGER NOT NULL)"
+        )
+        self.connection.commit()
+
+    def _read(self) -> Optional[int]:
+        row = self.connection.execute(
+            "SELECT update_id FROM offsets WHERE key = ?",
+            (self.key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _write(self, update_id: int) -> None:
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO offsets (key, update_id) VALUES (?, ?)",
+                (self.key, update_id)
+            )
+
+    def close(self) -> None:
+        super().close()
+        self.connection.close()
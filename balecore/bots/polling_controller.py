@@ -0,0 +1,73 @@
+from typing import Any, Dict
+
+
+class PollingController:
+    def __init__(
+        self,
+        limit: int = 120,
+        timeout: int = 30,
+        min_limit: int = 10,
+        max_limit: int = 1000,
+        min_timeout: int = 1,
+        max_timeout: int = 30,
+        high_watermark: float = 0.8,
+        max_delay: float = 1.0
+    ) -> None:
+        self.limit = limit
+        self.timeout = timeout
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.high_watermark = high_watermark
+        self.max_delay = max_delay
+        self.delay = 0.0
+        self.polls = 0
+        self.full_batches = 0
+        self.empty_batches = 0
+        self.backoffs = 0
+        self.last_batch_size = 0
+
+    def update(
+        self,
+        batch_size: int,
+        queue_depth: int,
+        queue_capacity: int,
+        active_handlers: int
+    ) -> None:
+        self.polls += 1
+        self.last_batch_size = batch_size
+
+        if queue_capacity and queue_depth >= queue_capacity * self.high_watermark:
+            self.backoffs += 1
+            free_slots = max(queue_capacity - queue_depth, self.min_limit)
+            self.limit = max(self.min_limit, min(self.limit // 2, free_slots))
+            self.delay = min(max(self.delay * 2, 0.05), self.max_delay)
+            return
+
+        self.delay = 0.0
+
+        if batch_size == 0:
+            self.empty_batches += 1
+            self.timeout = min(self.max_timeout, self.timeout * 2)
+            return
+
+        if batch_size >= self.limit:
+            self.full_batches += 1
+            self.limit = min(self.max_limit, self.limit * 2)
+
+        if active_handlers == 0:
+            self.timeout = max(self.min_timeout, self.timeout // 2)
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "timeout": self.timeout,
+            "delay": self.delay,
+            "polls": self.polls,
+            "full_batches": self.full_batches,
+            "empty_batches": self.empty_batches,
+            "backoffs": self.backoffs,
+            "last_batch_size": self.last_batch_size
+        }
@@ -0,0 +1,95 @@
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+LANES = ("payment", "callback", "private", "group")
+
+
+class PriorityLanes:
+    def __init__(
+        self,
+        payment: int = 20,
+        callback: int = 40,
+        private: int = 60,
+        group: int = 60,
+        weights: Optional[Dict[str, int]] = None,
+        capacity: Optional[int] = None
+    ) -> None:
+        self.budgets: Dict[str, int] = {
+            "payment": payment,
+            "callback": callback,
+            "private": private,
+            "group": group
+        }
+        self.weights: Dict[str, int] = {"payment": 8, "callback": 4, "private": 2, "group": 1}
+        if weights:
+            self.weights.update(weights)
+        self.capacity = capacity
+        self.queues: Dict[str, Deque[Any]] = {lane: deque() for lane in LANES}
+        self.active: Dict[str, int] = {lane: 0 for lane in LANES}
+        self.processed: Dict[str, int] = {lane: 0 for lane in LANES}
+        self._current: Dict[str, int] = {lane: 0 for lane in LANES}
+        self._size = 0
+        self._ready = asyncio.Event()
+        self._room = asyncio.Event()
+
+    @staticmethod
+    def lane_for(update: Dict[str, Any]) -> str:
+        if "pre_checkout_query" in update:
+            return "payment"
+        if "callback_query" in update:
+            return "callback"
+        message = update.get("message")
+        if message is not None:
+            if "successful_payment" in message:
+                return "payment"
+            if message.get("chat", {}).get("type") == "private":
+                return "private"
+        return "group"
+
+    @property
+    def depths(self) -> Dict[str, int]:
+        return {lane: len(queue) for lane, queue in self.queues.items()}
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    async def put(self, lane: str, item: Any) -> None:
+        while self.capacity and self._size >= self.capacity:
+            self._room.clear()
+            await self._room.wait()
+        self.queues[lane].append(item)
+        self._size += 1
+        self._ready.set()
+
+    async def get(self) -> Tuple[str, Any]:
+        while True:
+            lane = self._pick()
+            if lane is not None:
+                self.active[lane] += 1
+                self._size -= 1
+                self._room.set()
+                return lane, self.queues[lane].popleft()
+            self._ready.clear()
+            await self._ready.wait()
+
+    def release(self, lane: str) -> None:
+        self.active[lane] -= 1
+        self.processed[lane] += 1
+        self._ready.set()
+
+    def _pick(self) -> Optional[str]:
+        chosen = None
+        total = 0
+        for lane in LANES:
+            if not self.queues[lane] or self.active[lane] >= self.budgets[lane]:
+                continue
+            weight = self.weights[lane]
+            total += weight
+            self._current[lane] += weight
+            if chosen is None or self._current[lane] > self._current[chosen]:
+                chosen = lane
+        if chosen is not None:
+            self._current[chosen] -= total
+        return chosen
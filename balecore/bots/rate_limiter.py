@@ -0,0 +1,98 @@
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+RATE_LIMIT_KEYS = ("user", "chat", "global")
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        rate: float,
+        per: float = 1.0,
+        burst: Optional[int] = None,
+        key: str = "user",
+        action: str = "reject",
+        max_delay: float = 10.0,
+        max_keys: int = 100000
+    ) -> None:
+        if rate <= 0 or per <= 0:
+            raise ValueError("rate and per must be positive")
+        if key not in RATE_LIMIT_KEYS:
+            raise ValueError(f"key must be one of {', '.join(RATE_LIMIT_KEYS)}")
+        if action not in ("reject", "defer"):
+            raise ValueError("action must be 'reject' or 'defer'")
+
+        self.rate = rate / per
+        self.burst = float(burst if burst is not None else max(rate, 1))
+        self.key = key
+        self.action = action
+        self.max_delay = max_delay
+        self.max_keys = max_keys
+        self.idle_expiry = self.burst / self.rate
+        self.allowed = 0
+        self.rejected = 0
+        self.deferred = 0
+        self._buckets: Dict[Hashable, Tuple[float, float]] = {}
+
+    def key_for(self, update: Dict[str, Any]) -> Optional[Hashable]:
+        if self.key == "global":
+            return "global"
+
+        for update_type in ("message", "callback_query", "pre_checkout_query"):
+            payload = update.get(update_type)
+            if payload is None:
+                continue
+            if self.key == "user":
+                return payload.get("from", {}).get("id")
+            message = payload.get("message", payload) if update_type == "callback_query" else payload
+            return message.get("chat", {}).get("id")
+        return None
+
+    def reserve(self, key: Hashable, now: Optional[float] = None) -> Optional[float]:
+        if now is None:
+            now = time.monotonic()
+
+        bucket = self._buckets.pop(key, None)
+        if bucket is None:
+            tokens = self.burst
+        else:
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+
+        if tokens >= 1:
+            delay = 0.0
+            tokens -= 1
+        elif self.action == "defer" and (1 - tokens) / self.rate <= self.max_delay:
+            delay = (1 - tokens) / self.rate
+            tokens -= 1
+        else:
+            delay = None
+
+        self._buckets[key] = (tokens, now)
+        self._expire(now)
+
+        if delay is None:
+            self.rejected += 1
+        elif delay:
+            self.deferred += 1
+        else:
+            self.allowed += 1
+        return delay
+
+    def check(self, update: Dict[str, Any]) -> Optional[float]:
+        key = self.key_for(update)
+        if key is None:
+            return 0.0
+        return self.reserve(key)
+
+    def _expire(self, now: float) -> None:
+        buckets = self._buckets
+        while buckets:
+            oldest = next(iter(buckets))
+            tokens, updated = buckets[oldest]
+            if len(buckets) <= self.max_keys and now - updated < self.idle_expiry - tokens / self.rate:
+                break
+            del buckets[oldest]
+
+    @property
+    def size(self) -> int:
+        return len(self._buckets)
@@ -0,0 +1,35 @@
+from collections import deque
+from typing import Deque, Set
+
+
+class UpdateDeduplicator:
+    def __init__(self, size: int = 10000) -> None:
+        self.size = size
+        self.hits = 0
+        self._order: Deque[int] = deque()
+        self._seen: Set[int] = set()
+
+    def is_duplicate(self, update_id: int) -> bool:
+        if update_id in self._seen:
+            self.hits += 1
+            return True
+
+        if len(self._order) >= self.size:
+            self._seen.discard(self._order.popleft())
+
+        self._order.append(update_id)
+        self._seen.add(update_id)
+        return False
+
+    def forget(self, update_id: int) -> None:
+        if update_id not in self._seen:
+            return
+
+        self._seen.discard(update_id)
+        if self._order[-1] == update_id:
+            self._order.pop()
+        else:
+            self._order.remove(update_id)
+
+    def __len__(self) -> int:
+        return len(self._order)
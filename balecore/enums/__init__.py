@@ -1,3 +1,4 @@
+from .backlog_policy import BacklogPolicy
 from .chat_action import ChatAction
 from .chat_member_status import ChatMemberStatus
 from .chat_type import ChatType
@@ -8,6 +9,7 @@ from .parse_mode import ParseMode
 from .sticker_type import StickerType
 
 __all__ = [
+    'BacklogPolicy',
     'ChatAction',
     'ChatMemberStatus',
     'ChatType',
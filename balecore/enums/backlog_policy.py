@@ -0,0 +1,6 @@
+from enum import Enum
+
+class BacklogPolicy(str, Enum):
+    DROP_OLDER = "drop_older"
+    LATEST_PER_CHAT = "latest_per_chat"
+    PARALLEL = "parallel"
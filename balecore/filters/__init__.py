@@ -1,4 +1,5 @@
 from .base_filter import Filter
-from .filters import Filters
+from .filters import Filters, parse_command
+from .keyword_automaton import KeywordAutomaton
 
-__all__ = ["Filter", "Filters"]
\ No newline at end of file
+__all__ = ["Filter", "Filters", "KeywordAutomaton", "parse_command"]
\ No newline at end of file
@@ -1,22 +1,201 @@
-from typing import Dict, Callable
+from typing import Dict, Callable, FrozenSet, Hashable, List, Optional, Tuple
 from functools import wraps
 
+COST_KEY = 0
+COST_COMPARE = 1
+COST_STRING = 2
+COST_REGEX = 3
+COST_CUSTOM = 4
+
 
 class Filter:
-    def __init__(self, filter_func: Callable[[Dict], bool]):
+    def __init__(
+        self,
+        filter_func: Optional[Callable[[Dict], bool]] = None,
+        commands: Optional[FrozenSet[str]] = None,
+        cost: int = COST_STRING,
+        key: Optional[Hashable] = None,
+        operator: Optional[str] = None,
+        operands: Tuple['Filter', ...] = (),
+        callback_data: Optional[str] = None,
+        callback_prefix: Optional[str] = None,
+        pattern_slot: Optional[int] = None
+    ):
         self.filter_func = filter_func
+        self.commands = commands
+        self.callback_data = callback_data
+        self.callback_prefix = callback_prefix
+        self.pattern_slot = pattern_slot
+        self.cost = cost
+        self.key = key
+        self.operator = operator
+        self.operands = operands
+        self._compiled: Optional[Callable[[Dict], bool]] = None
 
     def __call__(self, update: Dict) -> bool:
-        try:
-            return bool(self.filter_func(update))
-        except Exception:
-            return False
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self.compile()
+        return compiled(update)
 
     def __and__(self, other: 'Filter') -> 'Filter':
-        return Filter(lambda update: self(update) and other(update))
+        other = _as_filter(other)
+        self_commands = getattr(self, 'commands', None)
+        other_commands = getattr(other, 'commands', None)
+        if self_commands is not None and other_commands is not None:
+            commands = self_commands & other_commands
+        else:
+            commands = self_commands if self_commands is not None else other_commands
+        self_prefix = getattr(self, 'callback_prefix', None)
+        other_prefix = getattr(other, 'callback_prefix', None)
+        if self_prefix is not None and other_prefix is not None:
+            callback_prefix = max(self_prefix, other_prefix, key=len)
+        else:
+            callback_prefix = self_prefix if self_prefix is not None else other_prefix
+        callback_data = getattr(self, 'callback_data', None)
+        if callback_data is None:
+            callback_data = getattr(other, 'callback_data', None)
+        self_slot = getattr(self, 'pattern_slot', None)
+        other_slot = getattr(other, 'pattern_slot', None)
+        if self_slot is not None and other_slot is not None:
+            pattern_slot = min(self_slot, other_slot)
+        else:
+            pattern_slot = self_slot if self_slot is not None else other_slot
+        return Filter(
+            commands=commands,
+            cost=max(self.cost, other.cost),
+            operator="and",
+            operands=(self, other),
+            callback_data=callback_data,
+            callback_prefix=callback_prefix,
+            pattern_slot=pattern_slot
+        )
 
     def __or__(self, other: 'Filter') -> 'Filter':
-        return Filter(lambda update: self(update) or other(update))
+        other = _as_filter(other)
+        self_commands = getattr(self, 'commands', None)
+        other_commands = getattr(other, 'commands', None)
+        commands = (
+            self_commands | other_commands
+            if self_commands is not None and other_commands is not None
+            else None
+        )
+        return Filter(
+            commands=commands,
+            cost=max(self.cost, other.cost),
+            operator="or",
+            operands=(self, other)
+        )
 
     def __invert__(self) -> 'Filter':
-        return Filter(lambda update: not self(update))
\ No newline at end of file
+        return Filter(cost=self.cost, operator="not", operands=(self,))
+
+    @property
+    def identity(self) -> Hashable:
+        if self.operator is None:
+            if self.key is not None:
+                return self.key
+            if self.filter_func is not None and _is_plain(self):
+                return ("func", id(self.filter_func))
+            return ("filter", id(self))
+        return (self.operator, tuple(operand.identity for operand in self.operands))
+
+    def compile(self) -> Callable[[Dict], bool]:
+        self._compiled = self._optimize()._emit()
+        return self._compiled
+
+    def _optimize(self) -> 'Filter':
+        if self.operator is None or not _is_plain(self):
+            return self
+
+        if self.operator == "not":
+            operand = self.operands[0]._optimize()
+            if operand.operator == "not":
+                return operand.operands[0]._optimize()
+            return Filter(cost=operand.cost, operator="not", operands=(operand,))
+
+        flattened: List[Filter] = []
+        seen = set()
+        for operand in self.operands:
+            operand = operand._optimize()
+            children = operand.operands if operand.operator == self.operator else (operand,)
+            for child in children:
+                if child.identity not in seen:
+                    seen.add(child.identity)
+                    flattened.append(child)
+
+        if len(flattened) == 1:
+            return flattened[0]
+
+        flattened.sort(key=lambda operand: operand.cost)
+        return Filter(
+            commands=self.commands,
+            cost=self.cost,
+            operator=self.operator,
+            operands=tuple(flattened)
+        )
+
+    def _emit(self) -> Callable[[Dict], bool]:
+        if not _is_plain(self):
+            return _safe(self)
+
+        if self.operator is None:
+            return _safe(self.filter_func)
+
+        if self.operator == "not":
+            operand = self.operands[0]._emit()
+            return lambda update: not operand(update)
+
+        if self.operator == "and":
+            predicates = tuple(_leaf_or_emit(operand) for operand in self.operands)
+
+            def conjunction(update: Dict) -> bool:
+                try:
+                    for predicate in predicates:
+                        if not predicate(update):
+                            return False
+                    return True
+                except Exception:
+                    return False
+
+            return conjunction
+
+        predicates = tuple(_leaf_or_emit(operand) for operand in self.operands)
+
+        def disjunction(update: Dict) -> bool:
+            for predicate in predicates:
+                try:
+                    if predicate(update):
+                        return True
+                except Exception:
+                    pass
+            return False
+
+        return disjunction
+
+
+def _is_plain(filter_obj: Filter) -> bool:
+    return type(filter_obj).__call__ is Filter.__call__
+
+
+def _as_filter(other: Callable[[Dict], bool]) -> Filter:
+    if isinstance(other, Filter):
+        return other
+    return Filter(other, cost=COST_CUSTOM)
+
+
+def _leaf_or_emit(filter_obj: Filter) -> Callable[[Dict], bool]:
+    if filter_obj.operator is None and _is_plain(filter_obj):
+        return filter_obj.filter_func
+    return filter_obj._emit()
+
+
+def _safe(func: Callable[[Dict], bool]) -> Callable[[Dict], bool]:
+    @wraps(func)
+    def safe_predicate(update: Dict) -> bool:
+        try:
+            return bool(func(update))
+        except Exception:
+            return False
+
+    return safe_predicate
@@ -0,0 +1,20 @@
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+current_update: ContextVar[Optional[Any]] = ContextVar("current_update", default=None)
+
+
+def dispatch_state(update: Dict[str, Any]) -> Optional[Any]:
+    update_wrapper = current_update.get()
+    if update_wrapper is None or update_wrapper.update is not update:
+        return None
+    return update_wrapper
+
+
+def record_result(update: Dict[str, Any], name: str, value: Any) -> None:
+    update_wrapper = dispatch_state(update)
+    if update_wrapper is None:
+        return
+    if update_wrapper.filter_results is None:
+        update_wrapper.filter_results = {}
+    update_wrapper.filter_results[name] = value
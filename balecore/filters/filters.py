@@ -1,10 +1,27 @@
-from typing import List, Optional, Dict, Any, Callable
-from .base_filter import Filter
-from functools import wraps
+import re
+from typing import List, Optional, Dict, Any, Callable, Tuple, Union, Pattern, Hashable
+from .base_filter import Filter, COST_KEY, COST_COMPARE, COST_STRING, COST_REGEX, COST_CUSTOM
+from .keyword_automaton import KeywordAutomaton
+from .pattern_set import PatternSet
+from .filter_context import record_result
+from functools import wraps, cached_property
+
+
+def parse_command(text: str) -> Optional[Tuple[str, Optional[str]]]:
+    if not text.startswith("/"):
+        return None
+    token = text.split(None, 1)[0][1:]
+    if not token:
+        return None
+    command, _, mention = token.partition("@")
+    return command, mention or None
+
 
 class Filters:
     def __init__(self, bot: Any):
         self.bot = bot
+        pattern_set = getattr(bot, "pattern_set", None)
+        self.pattern_set = pattern_set if pattern_set is not None else PatternSet()
 
     def state(self, state: str) -> Filter:
         return Filter(
@@ -16,135 +33,163 @@ class Filters:
                 ("callback_query" in update 
                  and "from" in update["callback_query"]
                  and self.bot.get_user_state(update["callback_query"]["from"]["id"]) == state)
-            )
+            ),
+            cost=COST_COMPARE,
+            key=("state", state)
         )
 
-    @property
+    @cached_property
     def any_message(self) -> Filter:
-        return Filter(lambda update: "message" in update)
+        return Filter(lambda update: "message" in update, cost=COST_KEY, key=("any_message",))
 
-    @property
+    @cached_property
     def private(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update
                 and "chat" in update["message"]
                 and update["message"]["chat"]["type"] == "private"
-            )
+            ),
+            cost=COST_COMPARE,
+            key=("private",)
         )
 
-    @property
+    @cached_property
     def group(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update
                 and "chat" in update["message"]
                 and update["message"]["chat"]["type"] == "group"
-            )
+            ),
+            cost=COST_COMPARE,
+            key=("group",)
         )
 
-    @property
+    @cached_property
     def channel(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update
                 and "chat" in update["message"]
                 and update["message"]["chat"]["type"] == "channel"
-            )
+            ),
+            cost=COST_COMPARE,
+            key=("channel",)
         )
 
-    @property
+    @cached_property
     def text(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update 
                 and "text" in update["message"]
                 and isinstance(update["message"]["text"], str)
-            )
+            ),
+            cost=COST_KEY,
+            key=("text",)
         )
 
-    @property
+    @cached_property
     def video(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update 
                 and "video" in update["message"]
-            )
+            ),
+            cost=COST_KEY,
+            key=("video",)
         )
 
-    @property
+    @cached_property
     def location(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update 
                 and "location" in update["message"]
-            )
+            ),
+            cost=COST_KEY,
+            key=("location",)
         )
 
-    @property
+    @cached_property
     def photo(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update 
                 and "photo" in update["message"]
-            )
+            ),
+            cost=COST_KEY,
+            key=("photo",)
         )
 
-    @property
+    @cached_property
     def reply(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update
                 and "reply_to_message" in update["message"]
-            )
+            ),
+            cost=COST_KEY,
+            key=("reply",)
         )
 
-    @property
+    @cached_property
     def supergroup_chat_created(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update
                 and "supergroup_chat_created" in update["message"]
-            )
+            ),
+            cost=COST_KEY,
+            key=("supergroup_chat_created",)
         )
 
-    @property
+    @cached_property
     def pinned_message(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update
                 and "pinned_message" in update["message"]
-            )
+            ),
+            cost=COST_KEY,
+            key=("pinned_message",)
         )
 
-    @property
+    @cached_property
     def new_chat_title(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update
                 and "new_chat_title" in update["message"]
-            )
+            ),
+            cost=COST_KEY,
+            key=("new_chat_title",)
         )
 
-    @property
+    @cached_property
     def new_chat_photo(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update
                 and "new_chat_photo" in update["message"]
-            )
+            ),
+            cost=COST_KEY,
+            key=("new_chat_photo",)
         )
 
-    @property
+    @cached_property
     def new_chat_members(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update
                 and "new_chat_members" in update["message"]
-            )
+            ),
+            cost=COST_KEY,
+            key=("new_chat_members",)
         )
 
-    @property
+    @cached_property
     def media(self) -> Filter:
         return Filter(
             lambda update: (
@@ -156,130 +201,149 @@ class Filters:
                     or "audio" in update["message"]
                     or "voice" in update["message"]
                 )
-            )
+            ),
+            cost=COST_KEY,
+            key=("media",)
         )
 
-    @property
+    @cached_property
     def left_chat_member(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update
                 and "left_chat_member" in update["message"]
-            )
+            ),
+            cost=COST_KEY,
+            key=("left_chat_member",)
         )
 
-    @property
+    @cached_property
     def group_chat_created(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update
                 and "group_chat_created" in update["message"]
-            )
+            ),
+            cost=COST_KEY,
+            key=("group_chat_created",)
         )
 
-    @property
+    @cached_property
     def forward(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update
                 and "forward_from" in update["message"]
-            )
+            ),
+            cost=COST_KEY,
+            key=("forward",)
         )
 
-    @property
+    @cached_property
     def document(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update
                 and "document" in update["message"]
-            )
+            ),
+            cost=COST_KEY,
+            key=("document",)
         )
 
-    @property
+    @cached_property
     def contact(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update
                 and "contact" in update["message"]
-            )
+            ),
+            cost=COST_KEY,
+            key=("contact",)
         )
 
-    @property
+    @cached_property
     def channel_chat_created(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update
                 and "channel_chat_created" in update["message"]
-            )
+            ),
+            cost=COST_KEY,
+            key=("channel_chat_created",)
         )
 
-    @property
+    @cached_property
     def caption(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update
                 and "caption" in update["message"]
-            )
+            ),
+            cost=COST_KEY,
+            key=("caption",)
         )
 
-    @property
+    @cached_property
     def all(self) -> Filter:
-        return Filter(lambda update: True)
+        return Filter(lambda update: True, cost=COST_KEY, key=("all",))
 
-    @property
+    @cached_property
     def audio(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update 
                 and "audio" in update["message"]
-            )
+            ),
+            cost=COST_KEY,
+            key=("audio",)
         )
 
-    @property
+    @cached_property
     def sticker(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update 
                 and "sticker" in update["message"]
-            )
+            ),
+            cost=COST_KEY,
+            key=("sticker",)
         )
 
-    @property
+    @cached_property
     def voice(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update 
                 and "voice" in update["message"]
-            )
+            ),
+            cost=COST_KEY,
+            key=("voice",)
         )
 
     def command(self, command: str, username: str = None, exact_match: bool = False) -> Filter:
             def async_filter_func(update: Dict) -> bool:
                 if not ("message" in update and "text" in update["message"]):
                     return False
-                
+
                 text = update["message"]["text"].strip()
-                
-                patterns = [
-                    f"/{command}",
-                    f"/{command}@{username}" if username else None,
-                    f"/{command} ",
-                    f"/{command}@{username} " if username else None
-                ]
-                
-                valid_patterns = [p for p in patterns if p is not None]
-                
+
                 if exact_match:
                     return text == f"/{command}" or (username and text == f"/{command}@{username}")
-                else:
-                    return any(
-                        text.startswith(pattern) or 
-                        text == f"/{command}" or 
-                        (username and text == f"/{command}@{username}")
-                        for pattern in valid_patterns
-                    )
 
-            return Filter(async_filter_func)
+                parsed = parse_command(text)
+                if parsed is None:
+                    return False
+
+                parsed_command, mention = parsed
+                return parsed_command == command and (
+                    username is None or mention is None or mention == username
+                )
+
+            return Filter(
+                async_filter_func,
+                commands=frozenset([command]),
+                key=("command", command, username, exact_match)
+            )
 
     def pattern(self, pattern: str) -> Filter:
         if pattern.startswith('/'):
@@ -287,45 +351,64 @@ class Filters:
         
         if '|' in pattern:
             patterns = [p.strip() for p in pattern.split('|')]
-            return Filter(
-                lambda update: (
-                    "message" in update
-                    and "text" in update["message"]
-                    and any(
-                        update["message"]["text"].startswith(p)
-                        for p in patterns
-                    )
-                )
-            )
-        
+        else:
+            patterns = [pattern]
+
+        prefixes = re.compile("|".join(re.escape(p) for p in patterns))
+        return self.regex(prefixes, cost=COST_STRING, key=("pattern", pattern))
+
+    def regex(
+        self,
+        pattern: Union[str, Pattern[str]],
+        cost: int = COST_REGEX,
+        key: Optional[Hashable] = None
+    ) -> Filter:
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+        pattern_set = self.pattern_set
+        slot = pattern_set.add(pattern)
+
+        def regex_filter(update: Dict) -> bool:
+            if not ("message" in update and "text" in update["message"]):
+                return False
+            text = update["message"]["text"]
+            if slot is not None:
+                first = pattern_set.first_match_cached(update, text)
+                if first is None or slot < first:
+                    return False
+            match = pattern.match(text)
+            if match is None:
+                return False
+            record_result(update, "match", match)
+            return True
+
         return Filter(
-            lambda update: (
-                "message" in update
-                and "text" in update["message"]
-                and update["message"]["text"].startswith(pattern)
-            )
+            regex_filter,
+            cost=cost,
+            key=key if key is not None else ("regex", pattern),
+            pattern_slot=slot
         )
 
     def multi_command(self, commands: List[str]) -> Filter:
-        return Filter(
-            lambda update: (
-                "message" in update
-                and "text" in update["message"]
-                and any(
-                    update["message"]["text"].startswith(f"/{cmd} ")
-                    or update["message"]["text"].startswith(f"/{cmd}@")
-                    or update["message"]["text"] == f"/{cmd}"
-                    for cmd in commands
-                )
-            )
-        )
+        command_set = frozenset(commands)
+
+        def multi_command_filter(update: Dict) -> bool:
+            if not ("message" in update and "text" in update["message"]):
+                return False
+            parsed = parse_command(update["message"]["text"])
+            return parsed is not None and parsed[0] in command_set
+
+        return Filter(multi_command_filter, commands=command_set, key=("multi_command", command_set))
 
     def callback_query(self, data: Optional[str] = None) -> Filter:
         return Filter(
             lambda update: (
                 "callback_query" in update
                 and (data is None or update["callback_query"].get("data") == data)
-            )
+            ),
+            cost=COST_COMPARE,
+            key=("callback_query", data),
+            callback_data=data
         )
 
     def callback_query_data_startswith(self, prefix: str) -> Filter:
@@ -333,36 +416,53 @@ class Filters:
             lambda update: (
                 "callback_query" in update
                 and update["callback_query"].get("data", "").startswith(prefix)
-            )
+            ),
+            key=("callback_query_data_startswith", prefix),
+            callback_prefix=prefix
         )
 
-    @property
+    @cached_property
     def callback_query_all(self) -> Filter:
-        return Filter(lambda update: "callback_query" in update)
+        return Filter(lambda update: "callback_query" in update, cost=COST_KEY, key=("callback_query_all",))
 
-    @property
+    @cached_property
     def pre_checkout_query(self) -> Filter:
-        return Filter(lambda update: "pre_checkout_query" in update)
+        return Filter(lambda update: "pre_checkout_query" in update, cost=COST_KEY, key=("pre_checkout_query",))
 
-    @property
+    @cached_property
     def successful_payment(self) -> Filter:
         return Filter(
             lambda update: (
                 "message" in update
                 and "successful_payment" in update["message"]
-            )
+            ),
+            cost=COST_KEY,
+            key=("successful_payment",)
         )
 
-    def contains_keywords(self, keywords: List[str]) -> Filter:
-        return Filter(
-            lambda update: (
-                "message" in update
-                and "text" in update["message"]
-                and any(
-                    keyword.lower() in update["message"]["text"].lower()
-                    for keyword in keywords
+    def contains_keywords(self, keywords: List[str], report: bool = False) -> Filter:
+        automaton = KeywordAutomaton(keywords)
+
+        if report:
+            def keywords_filter(update: Dict) -> bool:
+                if not ("message" in update and "text" in update["message"]):
+                    return False
+                matched = automaton.find_all(update["message"]["text"])
+                if matched:
+                    record_result(update, "matched_keywords", matched)
+                return bool(matched)
+        else:
+            def keywords_filter(update: Dict) -> bool:
+                return (
+                    "message" in update
+                    and "text" in update["message"]
+                    and automaton.search(update["message"]["text"])
                 )
-            )
+
+        return Filter(
+            keywords_filter,
+            cost=COST_REGEX,
+            key=("contains_keywords", automaton.keywords, report)
         )
 
     def long_message(self, min_length: int) -> Filter:
@@ -371,7 +471,9 @@ class Filters:
                 "message" in update
                 and "text" in update["message"]
                 and len(update["message"]["text"]) >= min_length
-            )
+            ),
+            cost=COST_COMPARE,
+            key=("long_message", min_length)
         )
     
     def custom(self, filter_func: Callable[[Dict], bool]) -> Filter:
@@ -381,4 +483,4 @@ class Filters:
                 return bool(filter_func(update))
             except Exception:
                 return False
-        return Filter(wrapper)
\ No newline at end of file
+        return Filter(wrapper, cost=COST_CUSTOM)
\ No newline at end of file
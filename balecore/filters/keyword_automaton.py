@@ -0,0 +1,75 @@
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+
+class KeywordAutomaton:
+    def __init__(self, keywords: Iterable[str], scan_threshold: int = 64) -> None:
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(
+            keyword.lower() for keyword in keywords if keyword
+        ))
+        self.scan = len(self.keywords) <= scan_threshold
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+        if not self.scan:
+            self._build()
+
+    def _build(self) -> None:
+        goto, fail, output = self._goto, self._fail, self._output
+
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    fail.append(0)
+                    output.append(())
+                state = next_state
+            output[state] = output[state] + (index,)
+
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                output[next_state] = output[next_state] + output[fail[next_state]]
+
+    def search(self, text: str) -> bool:
+        text = text.lower()
+        if self.scan:
+            return any(keyword in text for keyword in self.keywords)
+
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                return True
+        return False
+
+    def find_all(self, text: str) -> List[str]:
+        text = text.lower()
+        if self.scan:
+            return [keyword for keyword in self.keywords if keyword in text]
+
+        goto, fail, output = self._goto, self._fail, self._output
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            found.update(output[state])
+        return [self.keywords[index] for index in sorted(found)]
+
+    def __len__(self) -> int:
+        return len(self.keywords)
@@ -0,0 +1,74 @@
+import re
+from typing import Dict, List, Optional, Pattern, Set
+
+from .filter_context import dispatch_state
+
+_INLINE_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+)
+_SUPPORTED_FLAGS = re.UNICODE | re.IGNORECASE | re.MULTILINE | re.DOTALL
+_SLOT_PREFIX = "_slot"
+_UNSUPPORTED = re.compile(r"\(\?P=|\(\?\(|\\[1-9]|\\g<|\(\?[aiLmsux]+\)")
+
+
+class PatternSet:
+    def __init__(self) -> None:
+        self.patterns: List[Pattern[str]] = []
+        self._names: Set[str] = set()
+        self._combined: Optional[Pattern[str]] = None
+        self._size = -1
+        self.version = 0
+
+    def add(self, pattern: Pattern[str]) -> Optional[int]:
+        if not isinstance(pattern.pattern, str) or _UNSUPPORTED.search(pattern.pattern):
+            return None
+
+        if pattern.flags & ~_SUPPORTED_FLAGS:
+            return None
+
+        names = set(pattern.groupindex)
+        if names & self._names or any(name.startswith(_SLOT_PREFIX) for name in names):
+            return None
+
+        self._names |= names
+        self.patterns.append(pattern)
+        self.version += 1
+        return len(self.patterns) - 1
+
+    def rebuild(self) -> None:
+        alternatives = []
+        for slot, pattern in enumerate(self.patterns):
+            inline = "".join(
+                letter for flag, letter in _INLINE_FLAGS if pattern.flags & flag
+            )
+            body = f"(?{inline}:{pattern.pattern})" if inline else f"(?:{pattern.pattern})"
+            alternatives.append(f"{body}(?P<{_SLOT_PREFIX}{slot}>)")
+        self._combined = re.compile("|".join(alternatives)) if alternatives else None
+        self._size = len(self.patterns)
+
+    def first_match(self, text: str) -> Optional[int]:
+        if self._size != len(self.patterns):
+            self.rebuild()
+        if self._combined is None:
+            return None
+        match = self._combined.match(text)
+        if match is None:
+            return None
+        return int(match.lastgroup[len(_SLOT_PREFIX):])
+
+    def first_match_cached(self, update: Dict, text: str) -> Optional[int]:
+        update_wrapper = dispatch_state(update)
+        if update_wrapper is None:
+            return self.first_match(text)
+
+        cache = update_wrapper.pattern_slots
+        if cache is None:
+            cache = update_wrapper.pattern_slots = {}
+        cached = cache.get(self)
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+        slot = self.first_match(text)
+        cache[self] = (self.version, slot)
+        return slot
@@ -1,4 +1,6 @@
 class CopyTextButton:
+    __slots__ = ("copy_text",)
+
     def __init__(self, copy_text):
         self.copy_text = copy_text
 
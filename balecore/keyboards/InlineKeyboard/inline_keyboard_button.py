@@ -1,4 +1,6 @@
 class InlineKeyboardButton:
+    __slots__ = ("text", "callback_data", "url", "web_app", "copy_text")
+
     def __init__(self, text, callback_data=None, url=None, web_app=None, copy_text=None):
         self.text = text
         self.callback_data = callback_data
@@ -1,6 +1,8 @@
 from .inline_keyboard_button import InlineKeyboardButton
 
 class InlineKeyboardMarkup:
+    __slots__ = ("keyboard",)
+
     def __init__(self, keyboard=None):
         self.keyboard = keyboard if keyboard else []
 
@@ -1,4 +1,6 @@
 class WebAppInfo:
+    __slots__ = ("url",)
+
     def __init__(self, url):
         self.url = url
 
@@ -1,4 +1,6 @@
 class ReplyKeyboardButton:
+    __slots__ = ("text", "request_contact", "request_location", "web_app")
+
     def __init__(self, text, request_contact=False, request_location=False, web_app=None):
         self.text = text
         self.request_contact = request_contact
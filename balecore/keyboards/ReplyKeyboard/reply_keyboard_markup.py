@@ -1,6 +1,8 @@
 from .reply_keyboard_button import ReplyKeyboardButton
 
 class ReplyKeyboardMarkup:
+    __slots__ = ("keyboard", "selective")
+
     def __init__(self, keyboard=None, selective=None):
         self.keyboard = keyboard if keyboard else []
         self.selective = selective
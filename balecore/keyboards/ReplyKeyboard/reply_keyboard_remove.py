@@ -1,4 +1,6 @@
 class ReplyKeyboardRemove:
+    __slots__ = ("remove_keyboard", "selective")
+
     def __init__(self, selective=False):
         self.remove_keyboard = True
         self.selective = selective
@@ -23,6 +23,7 @@ from .sticker import Sticker
 from .photo import Photo
 from .reply_markup import ReplyMarkup
 from .callback_query import CallbackQuery
+from .pre_checkout_query import PreCheckoutQuery
 from .contact import Contact
 from .message import Message
 from .update_wrapper import UpdateWrapper
@@ -53,6 +54,7 @@ __all__ = [
     'Photo',
     'ReplyMarkup',
     'CallbackQuery',
+    'PreCheckoutQuery',
     'Contact',
     'Message',
     'UpdateWrapper'
@@ -1,4 +1,15 @@
 class Audio:
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "duration",
+        "performer",
+        "title",
+        "file_name",
+        "mime_type",
+        "file_size",
+    )
+
     def __init__(self, audio_data: dict):
         self.file_id = audio_data.get("file_id")
         self.file_unique_id = audio_data.get("file_unique_id")
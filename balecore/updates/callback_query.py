@@ -1,20 +1,34 @@
 from .user import User
 from .message import Message
 from .reply_markup import ReplyMarkup
+from .lazy_attribute import LazyAttribute
 
 class CallbackQuery:
+    __slots__ = (
+        "raw",
+        "id",
+        "inline_message_id",
+        "chat_instance",
+        "data",
+        "game_short_name",
+        "suffix",
+        "_from_user",
+        "_message",
+        "_reply_markup",
+    )
+
+    from_user = LazyAttribute("from", User, source="raw", always=True)
+    message = LazyAttribute("message", Message, source="raw")
+    reply_markup = LazyAttribute("reply_markup", ReplyMarkup, source="raw")
+
     def __init__(self, callback_query_data: dict):
+        self.raw = callback_query_data
         self.id = callback_query_data.get("id")
-        self.from_user = User(callback_query_data.get("from", {}))
-        message_data = callback_query_data.get("message", {})
-        self.message = Message(message_data) if message_data else None
         self.inline_message_id = callback_query_data.get("inline_message_id")
         self.chat_instance = callback_query_data.get("chat_instance")
         self.data = callback_query_data.get("data")
         self.game_short_name = callback_query_data.get("game_short_name")
-        
-        reply_markup_data = callback_query_data.get("reply_markup", {})
-        self.reply_markup = ReplyMarkup(reply_markup_data) if reply_markup_data else None
+        self.suffix = None
 
     def __str__(self):
         fields = []
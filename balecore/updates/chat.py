@@ -1,6 +1,17 @@
 from .photo_size import PhotoSize
 
 class Chat:
+    __slots__ = (
+        "id",
+        "type",
+        "title",
+        "username",
+        "photo",
+        "description",
+        "invite_link",
+        "permissions",
+    )
+
     def __init__(self, chat_data: dict):
         self.id = chat_data.get("id")
         self.type = chat_data.get("type")
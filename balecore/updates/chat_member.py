@@ -1,6 +1,28 @@
 from .user import User
 
 class ChatMember:
+    __slots__ = (
+        "user",
+        "status",
+        "custom_title",
+        "until_date",
+        "can_be_edited",
+        "can_post_messages",
+        "can_edit_messages",
+        "can_delete_messages",
+        "can_restrict_members",
+        "can_promote_members",
+        "can_change_info",
+        "can_invite_users",
+        "can_pin_messages",
+        "is_member",
+        "can_send_messages",
+        "can_send_media_messages",
+        "can_send_polls",
+        "can_send_other_messages",
+        "can_add_web_page_previews",
+    )
+
     def __init__(self, chat_member_data: dict):
         self.user = User(chat_member_data.get("user", {}))
         self.status = chat_member_data.get("status")
@@ -1,4 +1,15 @@
 class ChatParameter:
+    __slots__ = (
+        "id",
+        "type",
+        "title",
+        "username",
+        "photo",
+        "description",
+        "invite_link",
+        "permissions",
+    )
+
     def __init__(self, chat_data: dict):
         self.id = chat_data.get("id")
         self.type = chat_data.get("type")
@@ -1,4 +1,6 @@
 class ChatPhoto:
+    __slots__ = ("small_file_id", "big_file_id")
+
     def __init__(self, small_file_id: str, big_file_id: str):
         self.small_file_id = small_file_id
         self.big_file_id = big_file_id
@@ -1,4 +1,6 @@
 class Contact:
+    __slots__ = ("phone_number", "first_name", "last_name", "user_id", "vcard")
+
     def __init__(self, contact_data: dict):
         self.phone_number = contact_data.get("phone_number")
         self.first_name = contact_data.get("first_name")
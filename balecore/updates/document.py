@@ -1,4 +1,6 @@
 class Document:
+    __slots__ = ("file_id", "file_unique_id", "file_name", "mime_type", "file_size")
+
     def __init__(self, document_data: dict):
         self.file_id = document_data.get("file_id")
         self.file_unique_id = document_data.get("file_unique_id")
@@ -1,4 +1,6 @@
 class File:
+    __slots__ = ("file_id", "file_unique_id", "file_size", "file_path")
+
     def __init__(self, file_data: dict):
         self.file_id = file_data.get("file_id")
         self.file_unique_id = file_data.get("file_unique_id")
@@ -1,6 +1,8 @@
 from typing import Optional, Dict
 
 class InputFile:
+    __slots__ = ("file_path", "file_name", "mime_type")
+
     def __init__(self, file_path: str, file_name: Optional[str] = None, mime_type: Optional[str] = None):
         self.file_path = file_path
         self.file_name = file_name
@@ -1,6 +1,8 @@
 from typing import Optional, Dict, Any, Union
 
 class InputMedia:
+    __slots__ = ("type", "media", "caption", "parse_mode")
+
     def __init__(
         self,
         media_type: str,
@@ -26,11 +28,15 @@ class InputMedia:
 
 
 class InputMediaPhoto(InputMedia):
+    __slots__ = ()
+
     def __init__(self, media: str, caption: Optional[str] = None, parse_mode: Optional[str] = None):
         super().__init__("photo", media, caption, parse_mode)
 
 
 class InputMediaVideo(InputMedia):
+    __slots__ = ("width", "height", "duration")
+
     def __init__(
         self,
         media: str,
@@ -2,6 +2,8 @@ from typing import Optional, Dict, Any
 from .input_media import InputMedia
 
 class InputMediaAnimation(InputMedia):
+    __slots__ = ("duration", "width", "height")
+
     def __init__(
         self,
         media: str,
@@ -2,6 +2,8 @@ from typing import Optional, Dict, Any
 from .input_media import InputMedia
 
 class InputMediaAudio(InputMedia):
+    __slots__ = ("duration", "performer", "title")
+
     def __init__(
         self,
         media: str,
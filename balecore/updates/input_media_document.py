@@ -2,6 +2,8 @@ from typing import Optional, Dict, Any
 from .input_media import InputMedia
 
 class InputMediaDocument(InputMedia):
+    __slots__ = ("disable_content_type_detection",)
+
     def __init__(
         self,
         media: str,
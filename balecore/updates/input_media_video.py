@@ -2,6 +2,8 @@ from typing import Optional, Dict, Any
 from .input_media import InputMedia
 
 class InputMediaVideo(InputMedia):
+    __slots__ = ("width", "height", "duration")
+
     def __init__(
         self,
         media: str,
@@ -1,4 +1,6 @@
 class Invoice:
+    __slots__ = ("title", "description", "start_parameter", "currency", "total_amount")
+
     def __init__(self, invoice_data: dict):
         self.title = invoice_data.get("title")
         self.description = invoice_data.get("description")
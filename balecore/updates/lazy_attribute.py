@@ -0,0 +1,40 @@
+from typing import Any, Callable, Optional
+
+
+class LazyAttribute:
+    def __init__(
+        self,
+        key: str,
+        factory: Callable[[Any], Any],
+        source: str = "data",
+        always: bool = False
+    ) -> None:
+        self.key = key
+        self.factory = factory
+        self.source = source
+        self.always = always
+        self.name: Optional[str] = None
+        self.storage: Any = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.storage = owner.__dict__[f"_{name}"]
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        try:
+            return self.storage.__get__(instance, owner)
+        except AttributeError:
+            pass
+
+        raw = getattr(instance, self.source).get(self.key)
+        if raw or self.always:
+            value = self.factory(raw if raw is not None else {})
+        else:
+            value = None
+        self.storage.__set__(instance, value)
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        self.storage.__set__(instance, value)
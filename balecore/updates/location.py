@@ -1,4 +1,13 @@
 class Location:
+    __slots__ = (
+        "longitude",
+        "latitude",
+        "horizontal_accuracy",
+        "live_period",
+        "heading",
+        "proximity_alert_radius",
+    )
+
     def __init__(self, location_data: dict):
         self.longitude = location_data.get("longitude")
         self.latitude = location_data.get("latitude")
@@ -12,26 +12,48 @@ from .contact import Contact
 from .location import Location
 from .input_media_photo import InputMediaPhoto
 from .input_media_video import InputMediaVideo
+from .lazy_attribute import LazyAttribute
 
 class Message:
+    __slots__ = (
+        "message_id",
+        "date",
+        "text",
+        "caption",
+        "data",
+        "bot",
+        "_from_user",
+        "_chat",
+        "_photo",
+        "_video",
+        "_document",
+        "_audio",
+        "_voice",
+        "_sticker",
+        "_contact",
+        "_location",
+        "_reply_to_message",
+    )
+
+    from_user: Optional[User] = LazyAttribute("from", User)
+    chat: Chat = LazyAttribute("chat", Chat, always=True)
+    photo: Optional[Tuple[Photo, ...]] = LazyAttribute("photo", lambda photos: tuple(Photo(p) for p in photos))
+    video: Optional[Video] = LazyAttribute("video", Video)
+    document: Optional[Document] = LazyAttribute("document", Document)
+    audio: Optional[Audio] = LazyAttribute("audio", Audio)
+    voice: Optional[Voice] = LazyAttribute("voice", Voice)
+    sticker: Optional[Sticker] = LazyAttribute("sticker", Sticker)
+    contact: Optional[Contact] = LazyAttribute("contact", Contact)
+    location: Optional[Location] = LazyAttribute("location", Location)
+    reply_to_message: Optional['Message'] = LazyAttribute("reply_to_message", lambda data: Message(data))
+
     def __init__(self, message_data: Dict[str, Any]):
         self.message_id: Optional[int] = message_data.get("message_id")
-        self.from_user: Optional[User] = User(message_data.get("from", {})) if message_data.get("from") else None
         self.date: Optional[datetime] = message_data.get("date")
-        self.chat: Chat = Chat(message_data.get("chat", {}))
         self.text: Optional[str] = message_data.get("text")
         self.caption: Optional[str] = message_data.get("caption")
         self.data: Dict[str, Any] = message_data
         self.bot: Optional[Any] = None
-        self.photo: Optional[Tuple[Photo, ...]] = tuple(Photo(p) for p in message_data.get("photo", [])) if message_data.get("photo") else None
-        self.video: Optional[Video] = Video(message_data.get("video", {})) if message_data.get("video") else None
-        self.document: Optional[Document] = Document(message_data.get("document", {})) if message_data.get("document") else None
-        self.audio: Optional[Audio] = Audio(message_data.get("audio", {})) if message_data.get("audio") else None
-        self.voice: Optional[Voice] = Voice(message_data.get("voice", {})) if message_data.get("voice") else None
-        self.sticker: Optional[Sticker] = Sticker(message_data.get("sticker", {})) if message_data.get("sticker") else None
-        self.contact: Optional[Contact] = Contact(message_data.get("contact", {})) if message_data.get("contact") else None
-        self.location: Optional[Location] = Location(message_data.get("location", {})) if message_data.get("location") else None
-        self.reply_to_message: Optional[Message] = Message(message_data.get("reply_to_message", {})) if message_data.get("reply_to_message") else None
 
     async def reply(self, text: str, reply_markup=None, **kwargs) -> 'Message':
         if not self.bot:
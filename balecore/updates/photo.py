@@ -2,6 +2,8 @@ from .photo_size import PhotoSize
 from typing import Optional, Tuple
 
 class Photo:
+    __slots__ = ("file_id", "file_unique_id", "width", "height", "file_size", "photo_sizes")
+
     def __init__(self, photo_data: dict):
         self.file_id = photo_data.get("file_id")
         self.file_unique_id = photo_data.get("file_unique_id")
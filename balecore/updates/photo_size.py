@@ -1,4 +1,6 @@
 class PhotoSize:
+    __slots__ = ("file_id", "file_unique_id", "width", "height", "file_size")
+
     def __init__(self, photo_data: dict):
         self.file_id = photo_data.get("file_id")
         self.file_unique_id = photo_data.get("file_unique_id")
@@ -0,0 +1,39 @@
+from .user import User
+
+
+class PreCheckoutQuery:
+    __slots__ = (
+        "id",
+        "from_user",
+        "currency",
+        "total_amount",
+        "invoice_payload",
+        "shipping_option_id",
+        "order_info",
+    )
+
+    def __init__(self, pre_checkout_query_data: dict):
+        self.id = pre_checkout_query_data.get("id")
+        self.from_user = User(pre_checkout_query_data.get("from", {}))
+        self.currency = pre_checkout_query_data.get("currency")
+        self.total_amount = pre_checkout_query_data.get("total_amount")
+        self.invoice_payload = pre_checkout_query_data.get("invoice_payload")
+        self.shipping_option_id = pre_checkout_query_data.get("shipping_option_id")
+        self.order_info = pre_checkout_query_data.get("order_info")
+
+    def __str__(self):
+        fields = []
+        fields.append(f"id={self.id}")
+        fields.append(f"from_user={self.from_user}")
+        if self.currency is not None:
+            fields.append(f"currency={self.currency}")
+        if self.total_amount is not None:
+            fields.append(f"total_amount={self.total_amount}")
+        if self.invoice_payload is not None:
+            fields.append(f"invoice_payload={self.invoice_payload}")
+        if self.shipping_option_id is not None:
+            fields.append(f"shipping_option_id={self.shipping_option_id}")
+        if self.order_info is not None:
+            fields.append(f"order_info={self.order_info}")
+
+        return "PreCheckoutQuery(\n    " + ",\n    ".join(fields) + "\n)"
@@ -1,4 +1,6 @@
 class ReplyMarkup:
+    __slots__ = ("inline_keyboard", "keyboard", "remove_keyboard", "force_reply")
+
     def __init__(self, reply_markup_data: dict):
         self.inline_keyboard = reply_markup_data.get("inline_keyboard", [])
         self.keyboard = reply_markup_data.get("keyboard", [])
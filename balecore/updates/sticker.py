@@ -1,4 +1,17 @@
 class Sticker:
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "width",
+        "height",
+        "is_animated",
+        "is_video",
+        "emoji",
+        "set_name",
+        "mask_position",
+        "file_size",
+    )
+
     def __init__(self, sticker_data: dict):
         self.file_id = sticker_data.get("file_id")
         self.file_unique_id = sticker_data.get("file_unique_id")
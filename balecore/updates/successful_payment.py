@@ -1,4 +1,6 @@
 class SuccessfulPayment:
+    __slots__ = ("currency", "total_amount", "invoice_payload", "telegram_payment_charge_id")
+
     def __init__(self, successful_payment_data: dict):
         self.currency = successful_payment_data.get("currency")
         self.total_amount = successful_payment_data.get("total_amount")
@@ -1,21 +1,28 @@
 from .message import Message
 from .callback_query import CallbackQuery
+from .pre_checkout_query import PreCheckoutQuery
+from .lazy_attribute import LazyAttribute
 
 class UpdateWrapper:
+    __slots__ = (
+        "update",
+        "update_id",
+        "filter_results",
+        "pattern_slots",
+        "_message",
+        "_callback_query",
+        "_pre_checkout_query",
+    )
+
+    message = LazyAttribute("message", Message, source="update")
+    callback_query = LazyAttribute("callback_query", CallbackQuery, source="update")
+    pre_checkout_query = LazyAttribute("pre_checkout_query", PreCheckoutQuery, source="update")
+
     def __init__(self, update: dict):
         self.update = update
         self.update_id = update.get("update_id")
-        self.message = (
-            Message(update.get("message", {}))
-            if update.get("message")
-            else None
-        )
-        callback_query_data = update.get("callback_query", {})
-        self.callback_query = (
-            CallbackQuery(callback_query_data)
-            if callback_query_data
-            else None
-        )
+        self.filter_results = None
+        self.pattern_slots = None
 
     def __str__(self):
         fields = []
@@ -24,5 +31,7 @@ class UpdateWrapper:
             fields.append(f"message={self.message}")
         if self.callback_query is not None:
             fields.append(f"callback_query={self.callback_query}")
+        if self.pre_checkout_query is not None:
+            fields.append(f"pre_checkout_query={self.pre_checkout_query}")
         
         return "UpdateWrapper(\n    " + ",\n    ".join(fields) + "\n)"
\ No newline at end of file
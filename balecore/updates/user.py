@@ -1,4 +1,6 @@
 class User:
+    __slots__ = ("id", "is_bot", "first_name", "last_name", "username", "language_code")
+
     def __init__(self, user_data: dict):
         self.id = user_data.get("id")
         self.is_bot = user_data.get("is_bot")
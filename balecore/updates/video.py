@@ -1,4 +1,6 @@
 class Video:
+    __slots__ = ("file_id", "file_unique_id", "width", "height", "duration", "file_size")
+
     def __init__(self, video_data: dict):
         self.file_id = video_data.get("file_id")
         self.file_unique_id = video_data.get("file_unique_id")
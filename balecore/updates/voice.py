@@ -1,4 +1,6 @@
 class Voice:
+    __slots__ = ("file_id", "file_unique_id", "duration", "mime_type", "file_size")
+
     def __init__(self, voice_data: dict):
         self.file_id = voice_data.get("file_id")
         self.file_unique_id = voice_data.get("file_unique_id")
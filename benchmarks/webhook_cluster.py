@@ -0,0 +1,108 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import time
+
+import aiohttp
+
+from balecore import Bot
+
+UPDATE = {
+    "message": {
+        "message_id": 1,
+        "chat": {"id": 1, "type": "private"},
+        "from": {"id": 2},
+        "text": "hi"
+    }
+}
+
+
+class _BotInfo:
+    username = "benchmark"
+    id = 1
+
+
+def serve(workers: int, port: int, work: float) -> None:
+    bot = Bot("benchmark", dedup_window=None)
+
+    async def get_me(*args, **kwargs):
+        return _BotInfo()
+
+    bot.get_me = get_me
+
+    @bot.Message()
+    async def handler():
+        if work:
+            end = time.perf_counter() + work
+            while time.perf_counter() < end:
+                pass
+
+    bot.run_webhook_cluster(workers=workers, host="127.0.0.1", port=port, path="/")
+
+
+async def generate_load(port: int, duration: float, connections: int) -> tuple:
+    url = f"http://127.0.0.1:{port}/"
+    headers = {"Content-Type": "application/json"}
+    connector = aiohttp.TCPConnector(limit=connections)
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        for _ in range(100):
+            try:
+                async with session.post(url, data=json.dumps({"update_id": 0, **UPDATE}), headers=headers):
+                    break
+            except aiohttp.ClientError:
+                await asyncio.sleep(0.1)
+
+        counts = {"ok": 0, "failed": 0}
+        stop = time.perf_counter() + duration
+
+        async def client(update_id: int):
+            while time.perf_counter() < stop:
+                update_id += connections
+                body = json.dumps({"update_id": update_id, **UPDATE})
+                async with session.post(url, data=body, headers=headers) as response:
+                    counts["ok" if response.status == 200 else "failed"] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client(index) for index in range(connections)))
+        return counts["ok"] / (time.perf_counter() - started), counts["failed"]
+
+
+def measure(workers: int, args: argparse.Namespace) -> tuple:
+    server = multiprocessing.get_context("fork").Process(
+        target=serve,
+        args=(workers, args.port, args.work / 1e6)
+    )
+    server.start()
+    try:
+        time.sleep(1.5)
+        return asyncio.run(generate_load(args.port, args.duration, args.connections))
+    finally:
+        os.kill(server.pid, signal.SIGINT)
+        server.join(10)
+        if server.is_alive():
+            server.terminate()
+            server.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure run_webhook_cluster throughput per worker count.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to measure.")
+    parser.add_argument("--work", type=float, default=0.0, help="Busy-loop microseconds per handler call.")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds of load per worker count.")
+    parser.add_argument("--connections", type=int, default=64, help="Concurrent keep-alive connections.")
+    parser.add_argument("--port", type=int, default=18443, help="Local port for the cluster.")
+    args = parser.parse_args()
+
+    print(f"usable CPUs: {len(os.sched_getaffinity(0))}, handler work: {args.work:g}us")
+    print("workers  req/s   non-200")
+    for workers in args.workers:
+        rate, failed = measure(workers, args)
+        print(f"{workers:>7}  {rate:>6.0f}  {failed:>7}")
+
+
+if __name__ == "__main__":
+    main()